@@ -1,46 +1,198 @@
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import json
 import os
+import threading
+import time
 
 from fastapi import Request, HTTPException, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .database import get_db
+from .database import get_async_db, get_db
 from . import models
+from .utils.user_cache import cache_user, cache_user_async, get_cached_user, get_cached_user_async
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    # Built on first use; loading the bcrypt backend is kept off the import path
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
+# With an asymmetric ALGORITHM (ES256, EdDSA, ...) tokens are signed with the
+# private key and anyone holding the public key (see /auth/jwks.json) can
+# verify them. PEM text, or a path in JWT_PRIVATE_KEY_FILE / JWT_PUBLIC_KEY_FILE.
+JWT_KEY_ID = os.getenv("JWT_KEY_ID")
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+
+
+def _read_key(name):
+    path = os.getenv(f"{name}_FILE")
+    if path:
+        with open(path) as f:
+            return f.read()
+    return os.getenv(name)
+
+
+def is_asymmetric():
+    return not ALGORITHM.startswith("HS")
+
+
+@lru_cache(maxsize=None)
+def get_jwt_keys():
+    """
+    (signing key, verifying key), parsed once on first use. PyJWT itself
+    imports cryptography whenever it is installed, so only the key parsing
+    is deferred here, not that import.
+    """
+    if not is_asymmetric():
+        return SECRET_KEY, SECRET_KEY
+    from jwt.algorithms import get_default_algorithms
+
+    algorithm = get_default_algorithms()[ALGORITHM]
+    private_pem, public_pem = _read_key("JWT_PRIVATE_KEY"), _read_key("JWT_PUBLIC_KEY")
+    private_key = algorithm.prepare_key(private_pem) if private_pem else None
+    if public_pem:
+        public_key = algorithm.prepare_key(public_pem)
+    else:
+        public_key = private_key.public_key()
+    return private_key, public_key
+
+
+def get_jwks():
+    """Public verification key as a JWK Set; empty for shared-secret algorithms."""
+    if not is_asymmetric():
+        return {"keys": []}
+    from jwt.algorithms import get_default_algorithms
+
+    jwk = json.loads(get_default_algorithms()[ALGORITHM].to_jwk(get_jwt_keys()[1]))
+    jwk.update({"alg": ALGORITHM, "use": "sig"})
+    if JWT_KEY_ID:
+        jwk["kid"] = JWT_KEY_ID
+    return {"keys": [jwk]}
+
 def verify_password(plain, hashed):
-    return pwd_context.verify(plain, hashed)
+    return get_pwd_context().verify(plain, hashed)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+
+# bcrypt releases the GIL, so a thread pool gives real parallelism without
+# blocking the event loop. Work beyond workers + queue is refused with 503.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", PASSWORD_HASH_WORKERS * 4))
+
+_hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE)
+
+async def _run_hashing(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_slots.release()
+
+async def verify_password_async(plain, hashed):
+    return await _run_hashing(verify_password, plain, hashed)
+
+async def get_password_hash_async(password):
+    return await _run_hashing(get_password_hash, password)
+
+def hash_passwords(passwords, workers: int = PASSWORD_HASH_WORKERS):
+    """
+    Hash many passwords on `workers` threads of their own, e.g. for a bulk
+    import. Does not go through the request queue above, so size `workers`
+    to leave room for logins when calling this from the API.
+    """
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt-bulk") as executor:
+        return list(executor.map(get_password_hash, passwords))
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    headers = {"kid": JWT_KEY_ID} if JWT_KEY_ID else None
+    return jwt.encode(to_encode, get_jwt_keys()[0], algorithm=ALGORITHM, headers=headers)
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
+
+# Verified token -> (exp, claims). The same cookie arrives on every request
+# until it expires, so its signature only needs checking once per process.
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+def decode_token(token: str):
+    """
+    Claims of a valid, unexpired token. Raises jwt.InvalidTokenError otherwise.
+    Treat the returned dict as read-only; it is shared between requests.
+    """
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _token_cache.move_to_end(token)
+                return entry[1]
+            del _token_cache[token]
+
+    claims = jwt.decode(token, get_jwt_keys()[1], algorithms=[ALGORITHM])
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[token] = (exp, claims)
+            while len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    return claims
+
+def get_token_subject(request: Request):
     token = request.cookies.get("access_token")
     if not token:
         raise HTTPException(status_code=401, detail="User Not Logged In.")
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         email = payload.get("sub")
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return email
+
+def get_current_user(request: Request, db: Session = Depends(get_db)):
+    email = get_token_subject(request)
+    cached = get_cached_user(email)
+    if cached:
+        return db.merge(cached, load=False)
 
     user = db.query(models.User).filter(models.User.email == email).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    cache_user(user)
+    return user
+
+async def get_current_user_async(request: Request, db: AsyncSession = Depends(get_async_db)):
+    email = get_token_subject(request)
+    cached = await get_cached_user_async(email)
+    if cached:
+        return await db.merge(cached, load=False)
+
+    result = await db.execute(select(models.User).filter(models.User.email == email))
+    user = result.scalars().first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    await cache_user_async(user)
     return user
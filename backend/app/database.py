@@ -1,8 +1,10 @@
 from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
+from app.utils.pool_stats import TimedAsyncQueuePool, TimedQueuePool
 
 load_dotenv()
 
@@ -10,7 +12,7 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 
 from sqlalchemy.engine.url import URL
 
-def get_engine():
+def get_database_url(drivername=None):
     use_unix_socket = os.getenv("USE_UNIX_SOCKET", "false").lower() == "true"
 
     if use_unix_socket:
@@ -19,27 +21,67 @@ def get_engine():
         db_pass = os.environ["DB_PASS"]
         db_name = os.environ["DB_NAME"]
         unix_socket_path = os.environ["INSTANCE_UNIX_SOCKET"]  # e.g. /cloudsql/...
-        
-        return create_engine(
-            URL.create(
-                drivername="postgresql+psycopg2",  # or mysql+pymysql for MySQL
-                username=db_user,
-                password=db_pass,
-                database=db_name,
-                query={"host": unix_socket_path},
-            )
+
+        return URL.create(
+            drivername=drivername or "postgresql+psycopg2",  # or mysql+pymysql for MySQL
+            username=db_user,
+            password=db_pass,
+            database=db_name,
+            query={"host": unix_socket_path},
         )
     else:
         # Local dev over TCP
         db_url = os.getenv("DATABASE_URL")
         if not db_url:
             raise RuntimeError("DATABASE_URL not set for local dev")
-        return create_engine(db_url)
+        url = make_url(db_url)
+        return url.set(drivername=drivername) if drivername else url
+
+def get_pool_options():
+    """
+    Pool sizing from the environment. Each engine (sync and async) gets its own
+    pool, so an instance can hold up to 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    connections; size instances against Postgres max_connections accordingly.
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
 
-# Global engine
+# Milliseconds; unset or 0 leaves the server default
+STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+
+def get_engine():
+    connect_args = {}
+    if STATEMENT_TIMEOUT_MS:
+        connect_args["options"] = f"-c statement_timeout={STATEMENT_TIMEOUT_MS}"
+    return create_engine(
+        get_database_url(),
+        poolclass=TimedQueuePool,
+        connect_args=connect_args,
+        **get_pool_options(),
+    )
+
+def get_async_engine():
+    connect_args = {}
+    if STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {"statement_timeout": str(STATEMENT_TIMEOUT_MS)}
+    return create_async_engine(
+        get_database_url("postgresql+asyncpg"),
+        poolclass=TimedAsyncQueuePool,
+        connect_args=connect_args,
+        **get_pool_options(),
+    )
+
+# Global engines
 engine = get_engine()
+async_engine = get_async_engine()
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 def get_db():
@@ -48,3 +90,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,14 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import user, profiles, s3  # 👉 Import all your routers
-from app.database import engine
-from app import models
+from sqlalchemy import text
+from app.routes import user, profiles, s3, internal, admin  # 👉 Import all your routers
+from app.auth import get_jwt_keys, get_pwd_context
+from app.database import async_engine
+from app.utils import email as email_utils
+from app.utils.metrics import MetricsMiddleware
+from app.utils.rate_limit import RateLimitMiddleware
+from app.utils.response_cache import response_cache
+from app.utils.s3 import get_s3_client
+from app.utils.s3_cleanup import sweep_s3_deletions
 import os
 
-# Create DB tables
-models.Base.metadata.create_all(bind=engine)
+# DB schema is managed by Alembic: run `alembic upgrade head` from backend/ before deploying
 
-app = FastAPI()
+async def warm_up():
+    """Build the lazily created clients side by side instead of on the first requests."""
+    async def open_db_connection():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(
+        asyncio.to_thread(get_s3_client),
+        asyncio.to_thread(get_pwd_context().dummy_verify),
+        asyncio.to_thread(get_jwt_keys),
+        open_db_connection(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"[Warm-up Error] {result!r}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await email_utils.dispatcher.start()
+    response_cache.start_listening()
+    # Not awaited: the instance can take traffic while this runs
+    app.state.warm_up = asyncio.create_task(warm_up())
+    # Pick up S3 deletes left over from a previous instance, then retry failures as they come due
+    app.state.s3_sweeper = asyncio.create_task(sweep_s3_deletions())
+    yield
+    app.state.s3_sweeper.cancel()
+    response_cache.stop_listening()
+    await email_utils.dispatcher.stop()
+
+app = FastAPI(lifespan=lifespan)
+# Added before CORS so that CORS wraps it and 429s still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
 origins = os.getenv("CORS_ORIGINS", "").split(",")
 # Allow frontend to talk to backend
 app.add_middleware(
@@ -18,8 +58,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so the timings cover the other middleware and rejected requests too
+app.add_middleware(MetricsMiddleware)
 
 # Register all route modules
 app.include_router(user.router, tags=["Auth"])
 app.include_router(profiles.router, prefix="/profile", tags=["Profile"])
 app.include_router(s3.router, prefix="/s3", tags=["S3 Uploads"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
+app.include_router(internal.router, prefix="/internal", tags=["Internal"], include_in_schema=False)
+app.include_router(internal.metrics_router, tags=["Internal"], include_in_schema=False)
@@ -1,9 +1,14 @@
 import uuid
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Column, DateTime, String, Boolean, ForeignKey, JSON, func, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import DDL, Column, DateTime, Integer, String, Text, Boolean, ForeignKey, Index, JSON, cast, event, func, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .database import Base
 
+# Schema changes ship as Alembic migrations (backend/migrations); this only
+# covers metadata.create_all() on a scratch database.
+# Trigram indexes below need pg_trgm before the tables are created
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 class User(Base):
     __tablename__ = "users"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -12,11 +17,18 @@ class User(Base):
     hashed_password = Column(String)
     is_verified = Column(Boolean, default=False)
     last_verification_sent = Column(DateTime(timezone=True), nullable=True, default=func.now())
-    club_role = Column(String, nullable=True)
+    club_role = Column(String, nullable=True, index=True)
 
     profile = relationship("UserProfile", back_populates="user", uselist=False)
     images = relationship("UserImage", back_populates="user")
 
+    __table_args__ = (
+        # Keyset pagination of the profile directory orders by (username, id)
+        Index("ix_users_username_id", "username", "id"),
+        # Substring search over usernames
+        Index("ix_users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+    )
+
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
@@ -24,21 +36,34 @@ class UserProfile(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
     bio = Column(String, nullable=True)
-    branch = Column(String, nullable=True)
-    batch = Column(String, nullable=True)
-    hostel = Column(String, nullable=True)
+    branch = Column(String, nullable=True, index=True)
+    batch = Column(String, nullable=True, index=True)
+    hostel = Column(String, nullable=True, index=True)
     interests = Column(JSON, nullable=True)
 
     user = relationship("User", back_populates="profile")
 
+    __table_args__ = (
+        Index("ix_user_profiles_bio_trgm", "bio", postgresql_using="gin", postgresql_ops={"bio": "gin_trgm_ops"}),
+    )
+
+
+# Interest containment filters (`interests::jsonb @> [...]`)
+Index("ix_user_profiles_interests_gin", cast(UserProfile.interests, JSONB), postgresql_using="gin")
+
 
 class UserImage(Base):
     __tablename__ = "user_images"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     image_key = Column(String, nullable=False)   # S3 object key
     image_url = Column(String, nullable=False)   # Full public URL
+    # Resized WebP variants, filled in by the image pipeline after upload
+    thumbnail_key = Column(String, nullable=True)
+    thumbnail_url = Column(String, nullable=True)
+    medium_key = Column(String, nullable=True)
+    medium_url = Column(String, nullable=True)
 
     user = relationship("User", back_populates="images")
 
@@ -49,13 +74,78 @@ class ProfileReport(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    reported_profile_id = Column(UUID(as_uuid=True), ForeignKey("user_profiles.user_id"), nullable=False)
+    reported_profile_id = Column(UUID(as_uuid=True), ForeignKey("user_profiles.user_id"), nullable=False, index=True)
 
     reason = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     __table_args__ = (
         UniqueConstraint("reporter_id", "reported_profile_id", name="unique_report_per_pair"),
+        # Newest-first keyset pagination of the moderation queue
+        Index("ix_profile_reports_created_at_id", "created_at", "id"),
     )
 
     reporter = relationship("User", backref="reports_made")
     reported_profile = relationship("UserProfile", backref="reports_received")
+
+
+
+class InterestTag(Base):
+    """One row per normalized interest; `name` is the first spelling seen."""
+    __tablename__ = "interest_tags"
+
+    id = Column(Integer, primary_key=True)
+    slug = Column(String, nullable=False, unique=True)
+    name = Column(String, nullable=False)
+
+    __table_args__ = (
+        # Prefix lookups (`slug LIKE 'abc%'`) regardless of the database collation
+        Index("ix_interest_tags_slug_pattern", "slug", postgresql_ops={"slug": "text_pattern_ops"}),
+    )
+
+
+class ProfileInterestTag(Base):
+    """Which tags each profile lists; the primary key serves profile -> tags."""
+    __tablename__ = "profile_interest_tags"
+
+    profile_id = Column(UUID(as_uuid=True), ForeignKey("user_profiles.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey("interest_tags.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+
+class FacetCount(Base):
+    """
+    Running count of profiles per filter value, kept up to date on every
+    profile write so the directory filters never need a full-table GROUP BY.
+    """
+    __tablename__ = "facet_counts"
+
+    dimension = Column(String, primary_key=True)  # branch / hostel / batch / interests
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class EmailDeadLetter(Base):
+    """Outgoing mail that still failed after every retry."""
+    __tablename__ = "email_dead_letters"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=True)
+    message = Column(Text, nullable=False)  # full RFC 5322 message, so it can be re-sent
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class S3Deletion(Base):
+    """
+    Outbox of S3 objects to delete. Rows are written in the same transaction
+    that drops the UserImage, and removed once S3 confirms the delete.
+    """
+    __tablename__ = "s3_deletions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    image_key = Column(String, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,78 @@
+import io
+import os
+from datetime import datetime, timezone
+from typing import Literal
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.auth import get_current_user
+from app.database import get_db
+from app.models import User
+from app.schemas import ImportResult
+from app.utils.bulk_import import export_profiles, import_users, publish_imported, read_records, send_verification_emails
+
+router = APIRouter()
+
+# Imports through the API run inside one request, and bcrypt costs a few
+# hundred ms per row, so they are kept well under the Cloud Run request
+# timeout. Larger files go through `python -m app.utils.bulk_import import`.
+IMPORT_MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS", 200))
+IMPORT_MAX_BYTES = int(os.getenv("IMPORT_MAX_BYTES", 1024 * 1024))
+TOO_LARGE = "Import file too large for the API; use `python -m app.utils.bulk_import import` instead."
+CONTENT_TYPES = {"csv": "text/csv; charset=utf-8", "jsonl": "application/x-ndjson"}
+
+
+def _require_admin(user: User):
+    if user.club_role not in ["secretary", "coordinator"]:
+        raise HTTPException(status_code=403, detail="Forbidden.")
+
+
+@router.post("/import-users", response_model=ImportResult)
+async def import_users_file(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    format: Literal["csv", "jsonl"] = "csv",
+    mark_verified: bool = False,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Create users (and profiles) from a CSV or JSONL request body of at most
+    IMPORT_MAX_ROWS records. Verification mails are queued after the
+    response; records that fail validation or are already registered are
+    reported per line.
+    """
+    _require_admin(user)
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > IMPORT_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=TOO_LARGE)
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import file must be UTF-8.")
+
+    records = await run_in_threadpool(list, read_records(io.StringIO(text, newline=""), format))
+    if len(records) > IMPORT_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=TOO_LARGE)
+    result, created = await run_in_threadpool(import_users, db, records, mark_verified)
+    publish_imported(created)
+    if result["verification_emails"]:
+        background_tasks.add_task(send_verification_emails, [entry["email"] for entry in created])
+    return result
+
+
+@router.get("/export-profiles")
+def export_profiles_file(format: Literal["csv", "jsonl"] = "jsonl", user: User = Depends(get_current_user)):
+    """Every profile with its images, streamed as it is read from the database."""
+    _require_admin(user)
+
+    filename = f"profiles-{datetime.now(timezone.utc):%Y%m%d}.{format}"
+    return StreamingResponse(
+        export_profiles(format),
+        media_type=CONTENT_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
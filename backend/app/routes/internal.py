@@ -0,0 +1,40 @@
+import hmac
+import os
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.database import async_engine, engine
+from app.utils.metrics import render_metrics
+from app.utils.pool_stats import pool_stats
+
+router = APIRouter()
+# Served at the root as /metrics, where Prometheus looks by default
+metrics_router = APIRouter()
+
+INTERNAL_TOKEN = os.getenv("INTERNAL_TOKEN")
+
+
+def require_internal_token(token):
+    # Hidden entirely unless a token is configured; compared in constant time
+    if not INTERNAL_TOKEN or not hmac.compare_digest((token or "").encode(), INTERNAL_TOKEN.encode()):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@router.get("/pool-stats")
+def get_pool_stats(x_internal_token: str | None = Header(None)):
+    require_internal_token(x_internal_token)
+    return {
+        "sync": pool_stats(engine),
+        "async": pool_stats(async_engine.sync_engine),
+    }
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(x_internal_token: str | None = Header(None), authorization: str | None = Header(None)):
+    # Prometheus sends the token as `Authorization: Bearer ...`
+    if authorization and authorization.startswith("Bearer "):
+        x_internal_token = x_internal_token or authorization[len("Bearer "):]
+    require_internal_token(x_internal_token)
+    return PlainTextResponse(
+        render_metrics({"sync": engine, "async": async_engine.sync_engine}),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -1,13 +1,44 @@
-import os
 import re
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from app.database import get_db
-from app.auth import get_current_user
-from app.models import ProfileReport, User, UserProfile, UserImage
-from app.schemas import ProfileReportCreate, ProfileReportOut, UserProfileCreate, UserProfileWithUser
-from app.utils.s3 import delete_s3_object
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.database import get_async_db, get_db
+from app.auth import get_current_user, get_current_user_async
+from app.models import InterestTag, ProfileInterestTag, ProfileReport, User, UserProfile, UserImage
+from app.schemas import (
+    BulkIdsRequest,
+    BulkResult,
+    FacetValue,
+    InterestTagOut,
+    ProfilePage,
+    ProfileReportCreate,
+    ProfileReportOut,
+    ProfileReportPage,
+    ProfileSearchResult,
+    Recommendation,
+    ReportedProfilePage,
+    UserProfileCreate,
+    UserProfileWithUser,
+)
+from app.utils.facets import apply_facet_counts, apply_facet_delta, load_facet_catalog, profile_facet_values
+from app.utils.images import IMAGE_VARIANTS, process_image_variants, variant_key
+from app.utils.pagination import decode_cursor, decode_keyset, encode_cursor, encode_keyset
+from app.utils.recommendations import ensure_interest_index, interest_index, normalize_interests
+from app.utils.response_cache import (
+    CLUB_MEMBERS_TAG,
+    PROFILE_LIST_TAG,
+    invalidate_profile_responses,
+    profile_tag,
+    response_cache,
+)
+from app.utils.s3 import s3_public_url
+from app.utils.s3_cleanup import cancel_s3_deletions, flush_s3_deletions, queue_s3_deletions
+from app.utils.serialization import build_profile_dicts, select_image_rows, select_profile_rows, select_profiles, select_reports
+from app.utils.tags import ensure_tag_index, normalize_tag, profile_tag_names, sync_profile_tags, tag_index
+from datetime import datetime
+from typing import Dict, List, Optional, Union
 from uuid import UUID
 
 
@@ -16,12 +47,14 @@ router = APIRouter()
 @router.post("/create-or-update-profile")
 def create_or_update_profile(
     profile_data: UserProfileCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     # Check if profile exists
     profile = db.query(UserProfile).filter_by(user_id=user.id).first()
     email = user.email
+    facets_before = profile_facet_values(profile)
 
     # Update or create profile
     if profile:
@@ -36,56 +69,247 @@ def create_or_update_profile(
         profile.batch = f"Y{year}"
     else:
         raise HTTPException(400, "Invalid IITK email format")
+    apply_facet_delta(db, facets_before, profile_facet_values(profile))
+    db.flush()
+    tags_before, tags_after = sync_profile_tags(db, profile)
 
     # Handle image replacement
     if profile_data.image_keys:  # New images are provided
-        # Delete old images from S3 + DB
-        old_images = db.query(UserImage).filter_by(user_id=user.id).all()
-        for image in old_images:
-            delete_s3_object(image.image_key)
-            db.delete(image)
-
-        # Add new images
-        for key in profile_data.image_keys:
-            image_url = f"https://{os.getenv('AWS_S3_BUCKET')}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{key}"
-            db.add(UserImage(user_id=user.id, image_key=key, image_url=image_url))
+        # Delete old images from DB now, and from S3 after the response
+        old_keys = set()
+        old_images = db.query(UserImage.image_key, UserImage.thumbnail_key, UserImage.medium_key).filter_by(user_id=user.id)
+        for keys in old_images:
+            old_keys.update(key for key in keys if key)
+        db.query(UserImage).filter_by(user_id=user.id).delete(synchronize_session=False)
+        kept_keys = {
+            kept
+            for key in profile_data.image_keys
+            for kept in [key, *(variant_key(key, name) for name in IMAGE_VARIANTS)]
+        }
+        stale_keys = old_keys - kept_keys
+        # A key queued by an earlier replacement may be back (same file re-uploaded)
+        cancel_s3_deletions(db, kept_keys)
+        if stale_keys:
+            queue_s3_deletions(db, stale_keys)
+            background_tasks.add_task(flush_s3_deletions)
+
+        # Add new images; resized variants are generated after the response
+        new_images = [
+            UserImage(user_id=user.id, image_key=key, image_url=s3_public_url(key))
+            for key in profile_data.image_keys
+        ]
+        db.add_all(new_images)
+        db.flush()
+        background_tasks.add_task(process_image_variants, [image.id for image in new_images])
 
     db.commit()
+    invalidate_profile_responses(user.id, user.club_role)
     db.refresh(profile)
+    interest_index.update(user.id, profile.interests, profile.branch, profile.hostel)
+    tag_index.apply(tags_before, tags_after, profile_tag_names(profile.interests))
     return {"message":"Profile saved successfully"}
 
-@router.post("/get-all-profiles", response_model=List[UserProfileWithUser])
-def get_profiles(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+@router.post("/get-all-profiles", response_model=Union[ProfilePage, List[UserProfileWithUser]])
+async def get_profiles(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
+    db: AsyncSession = Depends(get_async_db),
+):
     """
-    Paginated route for profile data
+    Paginated route for profile data.
+
+    Without `cursor` this keeps the old skip/limit behaviour and returns a list.
+    With `cursor` it seeks past the last (username, id) seen, so every page costs
+    the same, and returns the page along with `next_cursor`.
+    The first page of either mode is served from the response cache.
     """
-    profiles = (
-        db.query(UserProfile)
-        .join(User, User.id == UserProfile.user_id)
-        .options(
-            joinedload(UserProfile.user),
-            joinedload(UserProfile.user).joinedload(User.images)
+    first_page = cursor == "" or (cursor is None and skip == 0)
+    cache_key = f"get-all-profiles:{'cursor' if cursor is not None else 'offset'}:{limit}"
+    if first_page:
+        cached = response_cache.get(cache_key)
+        if cached:
+            return cached.to_response(request)
+
+    stmt = select_profile_rows().order_by(User.username.asc(), User.id.asc())
+    if cursor is None:
+        stmt = stmt.offset(skip)
+    else:
+        stmt = _after_cursor(stmt, cursor)
+    rows = (await db.execute(stmt.limit(limit))).all()
+    image_rows = (await db.execute(select_image_rows([row.user_id for row in rows]))).all() if rows else []
+    profiles = build_profile_dicts(rows, image_rows)
+
+    if cursor is None:
+        data = profiles
+    else:
+        data = {"items": profiles, "next_cursor": _next_cursor(profiles, limit)}
+
+    if first_page:
+        return response_cache.store(cache_key, data, [PROFILE_LIST_TAG]).to_response(request)
+    return ORJSONResponse(data)
+
+
+def _after_cursor(query, cursor: str):
+    """
+    Restrict a profile select (joined with User) to rows after
+    the keyset cursor on (username, id). An empty cursor means the first page.
+    """
+    if not cursor:
+        return query
+    username, user_id = decode_cursor(cursor)
+    return query.filter(tuple_(User.username, User.id) > tuple_(username, user_id))
+
+
+def _next_cursor(profiles, limit: int):
+    """Cursor after the last of a full page of profile dicts, or None at the end."""
+    if len(profiles) < limit:
+        return None
+    last = profiles[-1]["user"]
+    return encode_cursor(last["username"], last["id"])
+
+
+def _search_filters(branch, hostel, batch, interests, q):
+    """
+    Build the WHERE clause for each search dimension, keyed by facet name,
+    so a facet can be counted against every filter except its own.
+    """
+    filters = {}
+    if branch:
+        filters["branch"] = UserProfile.branch == branch
+    if hostel:
+        filters["hostel"] = UserProfile.hostel == hostel
+    if batch:
+        filters["batch"] = UserProfile.batch == batch
+    if interests:
+        slugs = {slug for slug in map(normalize_tag, interests) if slug}
+        tagged = (
+            select(ProfileInterestTag.profile_id)
+            .join(InterestTag, InterestTag.id == ProfileInterestTag.tag_id)
+            .where(InterestTag.slug.in_(slugs))
+            .group_by(ProfileInterestTag.profile_id)
+            .having(func.count() == len(slugs))
         )
-        .order_by(User.username.asc())
-        .offset(skip)
-        .limit(limit)
+        filters["interests"] = UserProfile.id.in_(tagged)
+    if q:
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        filters["q"] = or_(
+            User.username.ilike(pattern, escape="\\"),
+            UserProfile.bio.ilike(pattern, escape="\\"),
+        )
+    return filters
+
+
+def _facet_counts(db: Session, value, clauses, joins=()):
+    query = (
+        db.query(value.label("value"))
+        .select_from(UserProfile)
+        .join(User, User.id == UserProfile.user_id)
+    )
+    for target, onclause in joins:
+        query = query.join(target, onclause)
+    matching = query.filter(*clauses).subquery()
+    count = func.count().label("count")
+    rows = (
+        db.query(matching.c.value, count)
+        .filter(matching.c.value.isnot(None))
+        .group_by(matching.c.value)
+        .order_by(count.desc(), matching.c.value)
         .all()
     )
-    return profiles
+    return [{"value": v, "count": c} for v, c in rows]
 
 
-@router.get("/get-my-profile", response_model=UserProfileWithUser)
-def get_my_profile(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    profile = (
-        db.query(UserProfile)
-        .filter_by(user_id=user.id)
-        .join(User, User.id == UserProfile.user_id)
-        .options(
-            joinedload(UserProfile.user),
-            joinedload(UserProfile.user).joinedload(User.images)
-        )
-        .first()
+FACETS_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+@router.get("/facets", response_model=Dict[str, List[FacetValue]])
+def get_facets(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Distinct branch / hostel / batch / interest values with profile counts,
+    served from the incrementally maintained facet_counts table.
+    """
+    catalog, etag = load_facet_catalog(db)
+    headers = {"ETag": etag, "Cache-Control": FACETS_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return catalog
+
+
+@router.get("/interest-tags", response_model=List[InterestTagOut])
+async def autocomplete_interest_tags(
+    response: Response,
+    prefix: str = "",
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Most used interest tags starting with `prefix`, from the in-memory tag index."""
+    await ensure_tag_index(db)
+    response.headers["Cache-Control"] = FACETS_CACHE_CONTROL
+    return tag_index.complete(prefix, limit)
+
+
+@router.get("/search-profiles", response_model=ProfileSearchResult)
+def search_profiles(
+    q: Optional[str] = Query(None, description="Substring of username or bio"),
+    branch: Optional[str] = None,
+    hostel: Optional[str] = None,
+    batch: Optional[str] = None,
+    interests: Optional[List[str]] = Query(None, description="Profiles must list all of these"),
+    cursor: str = "",
+    limit: int = Query(10, ge=1, le=100),
+    include_facets: bool = Query(False, description="Also count matches per branch, hostel, batch and interest"),
+    db: Session = Depends(get_db),
+):
+    """
+    Filtered, keyset-paginated profile search. Filtering happens in Postgres,
+    so non-matching rows never leave the database. Facet counts take a
+    table-wide GROUP BY each, so they are only computed on request; the
+    directory reads its filter options from /facets instead.
+    """
+    filters = _search_filters(branch, hostel, batch, interests, q)
+
+    stmt = (
+        select_profile_rows()
+        .filter(*filters.values())
+        .order_by(User.username.asc(), User.id.asc())
     )
+    rows = db.execute(_after_cursor(stmt, cursor).limit(limit)).all()
+    image_rows = db.execute(select_image_rows([row.user_id for row in rows])).all() if rows else []
+    profiles = build_profile_dicts(rows, image_rows)
+    next_cursor = _next_cursor(profiles, limit)
+    if not include_facets:
+        return ORJSONResponse({"items": profiles, "next_cursor": next_cursor})
+
+    facet_columns = {
+        "branch": (UserProfile.branch, []),
+        "hostel": (UserProfile.hostel, []),
+        "batch": (UserProfile.batch, []),
+        # Tag slugs, the same values the interests filter matches on
+        "interests": (
+            InterestTag.slug,
+            [
+                (ProfileInterestTag, ProfileInterestTag.profile_id == UserProfile.id),
+                (InterestTag, InterestTag.id == ProfileInterestTag.tag_id),
+            ],
+        ),
+    }
+    facets = {}
+    for name, (value, joins) in facet_columns.items():
+        others = [clause for key, clause in filters.items() if key != name]
+        facets[name] = _facet_counts(db, value, others, joins)
+
+    return ORJSONResponse({"items": profiles, "next_cursor": next_cursor, "facets": facets})
+
+
+@router.get("/get-my-profile", response_model=UserProfileWithUser)
+async def get_my_profile(db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user_async)):
+    result = await db.execute(select_profiles().filter(UserProfile.user_id == user.id))
+    profile = result.scalars().first()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -102,7 +326,12 @@ def get_my_profile(db: Session = Depends(get_db), user: User = Depends(get_curre
         "username": profile.user.username,
         "email": profile.user.email,
         "images": [
-            {"id": img.id, "image_url": img.image_url}
+            {
+                "id": img.id,
+                "image_url": img.image_url,
+                "thumbnail_url": img.thumbnail_url,
+                "medium_url": img.medium_url,
+            }
             for img in profile.user.images
         ],
         "is_verified": profile.user.is_verified
@@ -110,47 +339,84 @@ def get_my_profile(db: Session = Depends(get_db), user: User = Depends(get_curre
 }
 
 
-from fastapi import Query
-
 @router.get("/get-profile-by-id", response_model=UserProfileWithUser)
-def get_profile_by_user_id(
+async def get_profile_by_user_id(
+    request: Request,
     id: UUID = Query(..., description="UUID of the User"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    profile = (
-        db.query(UserProfile)
-        .filter_by(user_id=id)
-        .join(User, User.id == UserProfile.user_id)
-        .options(
-            joinedload(UserProfile.user),
-            joinedload(UserProfile.user).joinedload(User.images)
-        )
-        .first()
-    )
+    cache_key = f"get-profile-by-id:{id}"
+    cached = response_cache.get(cache_key)
+    if cached:
+        return cached.to_response(request)
 
-    if not profile:
+    rows = (await db.execute(select_profile_rows().filter(UserProfile.user_id == id))).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Profile not found for given user_id")
 
-    return profile
+    image_rows = (await db.execute(select_image_rows([id]))).all()
+    data = build_profile_dicts(rows, image_rows)[0]
+    return response_cache.store(cache_key, data, [profile_tag(id)]).to_response(request)
+
 @router.get("/get-club-members", response_model=List[UserProfileWithUser])
 def get_club_members(
+    request: Request,
     role: Optional[str] = Query(None, regex="^(secretary|coordinator)$"),
     db: Session = Depends(get_db),
 ):
-    query = (
-        db.query(UserProfile)
-        .join(User, User.id == UserProfile.user_id)
-        .options(
-            joinedload(UserProfile.user),
-            joinedload(UserProfile.user).joinedload(User.images)
-        )
-    )
+    cache_key = f"get-club-members:{role}"
+    cached = response_cache.get(cache_key)
+    if cached:
+        return cached.to_response(request)
 
+    stmt = select_profile_rows()
     if role:
-        query = query.filter(User.club_role == role)
+        stmt = stmt.filter(User.club_role == role)
+
+    rows = db.execute(stmt.order_by(User.username.asc())).all()
+    image_rows = db.execute(select_image_rows([row.user_id for row in rows])).all() if rows else []
+    data = build_profile_dicts(rows, image_rows)
+    # Without a role this lists every profile, so any profile write affects it
+    tag = CLUB_MEMBERS_TAG if role else PROFILE_LIST_TAG
+    return response_cache.store(cache_key, data, [tag]).to_response(request)
+
+@router.get("/recommendations", response_model=List[Recommendation])
+async def get_recommendations(
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
+):
+    """
+    Freshers ranked by interest overlap with the caller, plus shared hostel or
+    branch, scored from the in-memory interest index.
+    """
+    row = (await db.execute(
+        select(UserProfile.interests, UserProfile.branch, UserProfile.hostel).filter(UserProfile.user_id == user.id)
+    )).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Profile not found")
 
-    profiles = query.order_by(User.username.asc()).all()
-    return profiles
+    await ensure_interest_index(db)
+    ranked = interest_index.recommend(user.id, row.interests, row.branch, row.hostel, limit)
+    if not ranked:
+        return ORJSONResponse([])
+
+    user_ids = [user_id for user_id, _, _ in ranked]
+    rows = (await db.execute(select_profile_rows().filter(User.id.in_(user_ids)))).all()
+    image_rows = (await db.execute(select_image_rows(user_ids))).all()
+    profiles = {profile["user"]["id"]: profile for profile in build_profile_dicts(rows, image_rows)}
+
+    data = []
+    for user_id, score, shared in ranked:
+        profile = profiles.get(user_id)
+        if profile is None:  # deleted since the index was built
+            continue
+        shared_interests = [
+            interest for interest in profile["interests"] or []
+            if normalize_interests([interest]) & shared
+        ]
+        data.append({"profile": profile, "score": round(score, 4), "shared_interests": shared_interests})
+    return ORJSONResponse(data)
 
 from sqlalchemy.exc import IntegrityError
 
@@ -161,7 +427,6 @@ def report_profile(
     user = Depends(get_current_user),
 ):
     reported_profile = db.query(UserProfile).filter_by(user_id=report_data.reported_profile_id).first()
-    print(report_data.reported_profile_id)
     if not reported_profile:
         raise HTTPException(status_code=404, detail="Profile not found.")
     if reported_profile.user_id == user.id:
@@ -194,7 +459,91 @@ def get_reports(
             detail="Forbidden."
         )
 
-    return db.query(ProfileReport).all()
+    return db.execute(select_reports()).scalars().all()
+
+
+def _require_moderator(user: User):
+    if user.club_role not in ["secretary", "coordinator"]:
+        raise HTTPException(status_code=403, detail="Forbidden.")
+
+
+@router.get("/reports", response_model=ProfileReportPage)
+def list_reports(
+    cursor: str = "",
+    limit: int = Query(20, ge=1, le=100),
+    reported_profile_id: Optional[UUID] = Query(None, description="Only reports against this user's profile"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Newest-first, keyset-paginated moderation queue. Related users, profiles
+    and images are loaded in a fixed number of queries per page.
+    """
+    _require_moderator(current_user)
+
+    stmt = select_reports().order_by(ProfileReport.created_at.desc(), ProfileReport.id.desc())
+    if reported_profile_id:
+        stmt = stmt.filter(ProfileReport.reported_profile_id == reported_profile_id)
+    if cursor:
+        created_at, report_id = decode_keyset(cursor, datetime.fromisoformat, UUID)
+        stmt = stmt.filter(tuple_(ProfileReport.created_at, ProfileReport.id) < tuple_(created_at, report_id))
+
+    reports = db.execute(stmt.limit(limit)).scalars().all()
+    next_cursor = None
+    if len(reports) == limit:
+        next_cursor = encode_keyset(reports[-1].created_at, reports[-1].id)
+    return {"items": reports, "next_cursor": next_cursor}
+
+
+@router.get("/reported-profiles", response_model=ReportedProfilePage)
+def list_reported_profiles(
+    cursor: str = "",
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Reported profiles with their report counts, most reported (then most
+    recently reported) first, without sending individual report rows.
+    """
+    _require_moderator(current_user)
+
+    counts = (
+        select(
+            ProfileReport.reported_profile_id.label("user_id"),
+            func.count().label("report_count"),
+            func.max(ProfileReport.created_at).label("last_reported_at"),
+        )
+        .group_by(ProfileReport.reported_profile_id)
+        .subquery()
+    )
+    sort_key = (counts.c.report_count, counts.c.last_reported_at, counts.c.user_id)
+    stmt = select(counts).order_by(*(column.desc() for column in sort_key))
+    if cursor:
+        after = decode_keyset(cursor, int, datetime.fromisoformat, UUID)
+        stmt = stmt.filter(tuple_(*sort_key) < tuple_(*after))
+    groups = db.execute(stmt.limit(limit)).all()
+
+    profiles = {}
+    if groups:
+        user_ids = [group.user_id for group in groups]
+        for profile in db.execute(select_profiles().filter(UserProfile.user_id.in_(user_ids))).scalars():
+            profiles[profile.user_id] = profile
+
+    items = [
+        {
+            "profile": profiles[group.user_id],
+            "report_count": group.report_count,
+            "last_reported_at": group.last_reported_at,
+        }
+        for group in groups
+        if group.user_id in profiles
+    ]
+    next_cursor = None
+    if len(groups) == limit:
+        last = groups[-1]
+        next_cursor = encode_keyset(last.report_count, last.last_reported_at, last.user_id)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.delete("/delete-report/{report_id}")
@@ -211,17 +560,93 @@ def delete_report(report_id: UUID, db: Session = Depends(get_db), user: User = D
     return {"detail": "Report deleted successfully"}
 
 @router.post("/delete-profile/{profile_id}")
-def delete_profile_and_report(profile_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def delete_profile_and_report(
+    profile_id: UUID,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
     if user.club_role not in ["secretary", "coordinator"]:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    profile = db.query(UserProfile).filter(UserProfile.id == profile_id).first()
-    if not profile:
+    if not _delete_profiles(db, [profile_id], background_tasks):
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    db.query(ProfileReport).filter(ProfileReport.reported_profile_id == profile.user_id).delete(synchronize_session=False)
+    return {"detail": "Profile and associated reports deleted successfully"}
+
 
-    db.delete(profile)
+def _delete_profiles(db: Session, profile_ids, background_tasks: BackgroundTasks):
+    """
+    Delete profiles with their reports and images using set-based DELETEs in
+    one transaction, and queue every image object for batched S3 deletion.
+    :return: Set of profile ids that existed and were deleted
+    """
+    found = (
+        db.query(UserProfile, User.club_role)
+        .join(User, User.id == UserProfile.user_id)
+        .filter(UserProfile.id.in_(profile_ids))
+        .all()
+    )
+    if not found:
+        return set()
+
+    # Plain values only: the ORM rows are gone once the DELETEs commit
+    deleted = [(profile.id, profile.user_id, club_role) for profile, club_role in found]
+    deleted_tags = [profile_tag_names(profile.interests) for profile, _ in found]
+    user_ids = [user_id for _, user_id, _ in deleted]
+
+    facet_deltas = {}
+    for profile, _ in found:
+        for pair in profile_facet_values(profile):
+            facet_deltas[pair] = facet_deltas.get(pair, 0) - 1
+    apply_facet_counts(db, facet_deltas)
+
+    image_keys = set()
+    for keys in db.query(UserImage.image_key, UserImage.thumbnail_key, UserImage.medium_key).filter(UserImage.user_id.in_(user_ids)):
+        image_keys.update(key for key in keys if key)
+
+    db.query(ProfileReport).filter(ProfileReport.reported_profile_id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(UserImage).filter(UserImage.user_id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(UserProfile).filter(UserProfile.id.in_([profile_id for profile_id, _, _ in deleted])).delete(synchronize_session=False)
+    if image_keys:
+        queue_s3_deletions(db, image_keys)
     db.commit()
 
-    return {"detail": "Profile and associated reports deleted successfully"}
+    if image_keys:
+        background_tasks.add_task(flush_s3_deletions)
+    for _, user_id, club_role in deleted:
+        invalidate_profile_responses(user_id, club_role)
+        interest_index.remove(user_id)
+    for tags in deleted_tags:
+        tag_index.apply(tags, ())
+    return {profile_id for profile_id, _, _ in deleted}
+
+
+@router.post("/bulk-delete-reports", response_model=BulkResult)
+def bulk_delete_reports(body: BulkIdsRequest, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    """Dismiss many reports with a single DELETE."""
+    _require_moderator(user)
+
+    deleted = set(
+        db.execute(
+            ProfileReport.__table__.delete()
+            .where(ProfileReport.id.in_(body.ids))
+            .returning(ProfileReport.id)
+        ).scalars()
+    )
+    db.commit()
+    return {"results": [{"id": id, "status": "deleted" if id in deleted else "not_found"} for id in body.ids]}
+
+
+@router.post("/bulk-delete-profiles", response_model=BulkResult)
+def bulk_delete_profiles(
+    body: BulkIdsRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Delete many profiles, with their reports and images, in one transaction."""
+    _require_moderator(user)
+
+    deleted = _delete_profiles(db, body.ids, background_tasks)
+    return {"results": [{"id": id, "status": "deleted" if id in deleted else "not_found"} for id in body.ids]}
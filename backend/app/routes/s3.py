@@ -1,15 +1,33 @@
 from fastapi import APIRouter, HTTPException, Depends
-from app.utils.s3 import generate_presigned_post
+from app.utils.s3 import presign_prefix_upload
 from app.auth import get_current_user
+from app.schemas import PresignBatchRequest
 
 router = APIRouter()
 
+def user_prefix(user):
+    return f"user-profiles/{user.id}/"
+
 @router.get("/presign")
 def presign_upload(filename: str, user=Depends(get_current_user)):
     # create unique key for image
-    key = f"user-profiles/{user.id}/{filename}"
     try:
-        data = generate_presigned_post(key)
-        return {"upload_url": data["url"], "fields": data["fields"], "key": key}
+        data = presign_prefix_upload(user_prefix(user), filename)
+        return {"upload_url": data["url"], "fields": data["fields"], "key": data["key"]}
+    except Exception as e:
+        raise HTTPException(500, str(e))
+
+@router.post("/presign-batch")
+def presign_upload_batch(body: PresignBatchRequest, user=Depends(get_current_user)):
+    """Presigned POSTs for several files in one round trip."""
+    prefix = user_prefix(user)
+    try:
+        uploads = [presign_prefix_upload(prefix, filename) for filename in body.filenames]
     except Exception as e:
         raise HTTPException(500, str(e))
+    return {
+        "uploads": [
+            {"upload_url": data["url"], "fields": data["fields"], "key": data["key"]}
+            for data in uploads
+        ]
+    }
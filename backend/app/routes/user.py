@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import Response
 from pydantic import BaseModel, EmailStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app import models, schemas, auth
 from app.models import User
-from app.database import get_db
-from app.utils.email import send_verification_email
-from jose import JWTError, jwt
+from app.database import get_async_db, get_db
+from app.utils.email import queue_verification_email
+import jwt
 from datetime import datetime, timedelta, timezone
 import os
 import pytz
@@ -15,15 +17,16 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 RESEND_COOLDOWN = os.getenv("RESEND_COOLDOWN")
 FRONTEND_DOMAIN = os.getenv("FRONTEND_DOMAIN")
 @router.post("/signup")
-async def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def signup(user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
     email = user.email.lower()
-    existing = db.query(models.User).filter(models.User.email == str.lower(user.email)).first()
+    result = await db.execute(select(models.User).filter(models.User.email == email))
+    existing = result.scalars().first()
     if existing:
         if existing.is_verified:
             raise HTTPException(status_code=400, detail="User already registered")
         else:
             existing.username = user.username
-            existing.hashed_password = auth.get_password_hash(user.password)
+            existing.hashed_password = await auth.get_password_hash_async(user.password)
             existing.last_verification_sent = datetime.now(ist)
             target_user = existing
     else:
@@ -34,12 +37,11 @@ async def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
         target_user = models.User(
             username=user.username,
             email=email,
-            hashed_password=auth.get_password_hash(user.password),
+            hashed_password=await auth.get_password_hash_async(user.password),
             last_verification_sent=datetime.now(ist)
         )
         db.add(target_user)
-    db.commit()
-    db.refresh(target_user)
+    await db.commit()
 
     # Generate email verification token
     verification_token = auth.create_access_token(
@@ -48,10 +50,10 @@ async def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
     )
 
     try:
-        await send_verification_email(user.email, verification_token)
+        queue_verification_email(user.email, verification_token)
         target_user.last_verification_sent = datetime.now(ist)
 
-        db.commit()
+        await db.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to send verification mail. Login to try again.")
 
@@ -60,11 +62,11 @@ async def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
 @router.get("/verify-email")
 def verify_email(token: str, db: Session = Depends(get_db)):
     try:
-        payload = jwt.decode(token, auth.SECRET_KEY, algorithms=[auth.ALGORITHM])
+        payload = auth.decode_token(token)
         email = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=400, detail="Invalid token")
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=400, detail="Invalid or expired token")
 
     user = db.query(models.User).filter(models.User.email == email).first()
@@ -80,9 +82,10 @@ def verify_email(token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/login")
-def login(form: schemas.UserLogin, response: Response, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == form.email).first()
-    if not user or not auth.verify_password(form.password, user.hashed_password):
+async def login(form: schemas.UserLogin, response: Response, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(models.User).filter(models.User.email == form.email))
+    user = result.scalars().first()
+    if not user or not await auth.verify_password_async(form.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     if not user.is_verified:
@@ -114,13 +117,14 @@ class ResendRequest(BaseModel):
     password: str
 
 @router.post("/resend-verification")
-async def resend_mail (payload: ResendRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == payload.email).first()
+async def resend_mail (payload: ResendRequest, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(User).filter(User.email == payload.email))
+    user = result.scalars().first()
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
 
-    if not auth.verify_password(payload.password, user.hashed_password):
+    if not await auth.verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials.")
 
     if user.is_verified:
@@ -144,9 +148,9 @@ async def resend_mail (payload: ResendRequest, db: Session = Depends(get_db)):
         expires_delta=timedelta(minutes=10)
     )
     try:
-        await send_verification_email(user.email, token)
+        queue_verification_email(user.email, token)
         user.last_verification_sent = datetime.now(ist)
-        db.commit()
+        await db.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to send email. Try again later.")
 
@@ -154,11 +158,11 @@ async def resend_mail (payload: ResendRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me")
-def get_me(
+async def get_me(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = auth.get_current_user(request, db)
+    user = await auth.get_current_user_async(request, db)
     return {
         "email": user.email,
         "username": user.username,
@@ -166,6 +170,12 @@ def get_me(
         "club_role": user.club_role
     }
 
+@router.get("/jwks.json")
+def get_jwks(response: Response):
+    """Public key(s) for verifying access tokens outside this service."""
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return auth.get_jwks()
+
 @router.post("/logout")
 def logout(response: Response):
     # response.delete_cookie("access_token")
@@ -95,6 +95,7 @@
 
 
 
+import re
 from datetime import date, datetime
 from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field, validator
@@ -149,6 +150,8 @@ class UserProfileCreate(BaseModel):
 class UserImageOut(BaseModel):
     id: UUID
     image_url: str
+    thumbnail_url: Optional[str] = None
+    medium_url: Optional[str] = None
 
     class Config:
         orm_mode = True
@@ -191,6 +194,32 @@ class UserProfileWithUser(BaseModel):
         orm_mode = True
 
 
+class ProfilePage(BaseModel):
+    items: List[UserProfileWithUser]
+    next_cursor: Optional[str] = None
+
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class ProfileSearchResult(BaseModel):
+    items: List[UserProfileWithUser]
+    next_cursor: Optional[str] = None
+    facets: Optional[Dict[str, List[FacetValue]]] = None
+
+
+class InterestTagOut(BaseModel):
+    slug: str
+    name: str
+    count: int
+
+
+class PresignBatchRequest(BaseModel):
+    filenames: List[str] = Field(..., min_items=1, max_items=10)
+
+
 class ProfileReportCreate(BaseModel):
     reported_profile_id: UUID
     reason: Optional[str] = None
@@ -205,4 +234,81 @@ class ProfileReportOut(BaseModel):
     created_at: datetime
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class ProfileReportPage(BaseModel):
+    items: List[ProfileReportOut]
+    next_cursor: Optional[str] = None
+
+
+class ReportedProfileSummary(BaseModel):
+    profile: UserProfileWithUser
+    report_count: int
+    last_reported_at: datetime
+
+
+class ReportedProfilePage(BaseModel):
+    items: List[ReportedProfileSummary]
+    next_cursor: Optional[str] = None
+
+
+class Recommendation(BaseModel):
+    profile: UserProfileWithUser
+    score: float
+    shared_interests: List[str]
+
+
+class BulkIdsRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_items=1, max_items=500)
+
+
+class BulkOutcome(BaseModel):
+    id: UUID
+    status: str  # "deleted" or "not_found"
+
+
+class BulkResult(BaseModel):
+    results: List[BulkOutcome]
+
+
+class UserImportRow(BaseModel):
+    """One record of a bulk import file. Profile fields are optional."""
+    email: EmailStr
+    username: str = Field(..., min_length=1)
+    password: str = Field(..., min_length=1)
+    bio: Optional[str] = None
+    branch: Optional[str] = None
+    hostel: Optional[str] = None
+    interests: Optional[List[str]] = None
+
+    @validator("email")
+    def validate_iitk_email(cls, v):
+        v = v.lower()
+        if not re.search(r"\d{2}@iitk\.ac\.in$", v):
+            raise ValueError("Email must be an @iitk.ac.in address ending in the batch year")
+        return v
+
+    @validator("bio", "branch", "hostel", pre=True)
+    def empty_as_none(cls, v):
+        # CSV has no null, only empty cells
+        return v or None
+
+    @validator("interests", pre=True)
+    def split_interests(cls, v):
+        if isinstance(v, str):
+            return [part.strip() for part in v.split(";") if part.strip()] or None
+        return v
+
+
+class ImportRowIssue(BaseModel):
+    line: int
+    email: Optional[str]
+    detail: str
+
+
+class ImportResult(BaseModel):
+    created: int
+    verification_emails: int
+    skipped: List[ImportRowIssue]
+    errors: List[ImportRowIssue]
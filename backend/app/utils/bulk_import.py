@@ -0,0 +1,312 @@
+"""
+Bulk import of users and profiles from CSV or JSONL, and a streaming export
+of the profile directory. Also usable from the command line, from backend/:
+
+    python -m app.utils.bulk_import import freshers.csv
+    python -m app.utils.bulk_import import freshers.jsonl --verified
+    python -m app.utils.bulk_import export profiles.jsonl
+    python -m app.utils.bulk_import export - --format csv > profiles.csv
+
+Import files have one record per user with email, username and password, and
+optionally bio, branch, hostel and interests (";"-separated in CSV).
+
+POST /admin/import-users takes at most IMPORT_MAX_ROWS records per request,
+since it hashes every password before responding; use the CLI for a whole
+batch of freshers.
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pydantic import ValidationError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.auth import PASSWORD_HASH_WORKERS, create_access_token, hash_passwords
+from app.database import SessionLocal
+from app.models import User, UserProfile
+from app.schemas import UserImportRow
+from app.utils import email as email_utils
+from app.utils.facets import apply_facet_counts, profile_facet_values
+from app.utils.recommendations import interest_index
+from app.utils.response_cache import PROFILE_LIST_TAG, response_cache
+from app.utils.serialization import build_profile_dicts, dumps, select_image_rows, select_profile_rows
+from app.utils.tags import link_new_profile_tags, profile_tag_names, tag_index
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+# Threads hashing passwords for an import through the API; half the cores by
+# default so logins and signups keep theirs. The CLI uses every core.
+IMPORT_HASH_WORKERS = int(os.getenv("IMPORT_HASH_WORKERS", max(1, PASSWORD_HASH_WORKERS // 2)))
+# Imported users may not open their mail for a while; the link can be re-sent from the login page
+IMPORT_VERIFICATION_HOURS = int(os.getenv("IMPORT_VERIFICATION_HOURS", 72))
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 1000))
+
+BATCH_YEAR = re.compile(r"(\d{2})@iitk\.ac\.in$")
+FORMATS = ("csv", "jsonl")
+EXPORT_CSV_FIELDS = (
+    "user_id", "email", "username", "is_verified",
+    "profile_id", "bio", "branch", "batch", "hostel", "interests", "image_urls",
+)
+
+
+def _validation_message(error: ValidationError):
+    return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+
+
+def _parse_record(line: int, record):
+    if not isinstance(record, dict):
+        return line, None, None, "Expected an object"
+    email = record.get("email")
+    try:
+        return line, email, UserImportRow.parse_obj(record), None
+    except ValidationError as e:
+        return line, email, None, _validation_message(e)
+
+
+def read_records(stream, fmt: str):
+    """
+    Parse an import file lazily, so it never has to fit in memory at once.
+    :param stream: Text stream of a CSV file with a header row, or of JSONL
+    :param fmt: "csv" or "jsonl"
+    :return: Generator of (line number, email as given, UserImportRow or None, error or None)
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield _parse_record(reader.line_num, record)
+        return
+
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            yield line, None, None, "Invalid JSON"
+            continue
+        yield _parse_record(line, record)
+
+
+def _issue(line, email, detail):
+    return {"line": line, "email": email, "detail": detail}
+
+
+def import_users(
+    db: Session,
+    records,
+    mark_verified: bool = False,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    hash_workers: int = IMPORT_HASH_WORKERS,
+):
+    """
+    Create users, and a profile for each record with any profile field, from
+    read_records() output. Every batch is one multi-row INSERT per table,
+    committed on its own, with its passwords hashed in parallel. Emails that
+    are already registered are skipped, so a failed import can be re-run.
+    :return: (ImportResult-shaped dict, [{"user_id", "email", "profile"}] of created users)
+    """
+    result = {"created": 0, "verification_emails": 0, "skipped": [], "errors": []}
+    created, batch, seen = [], [], set()
+    for line, email, row, error in records:
+        if error:
+            result["errors"].append(_issue(line, email, error))
+            continue
+        if row.email in seen:
+            result["skipped"].append(_issue(line, row.email, "Duplicate of an earlier record"))
+            continue
+        seen.add(row.email)
+        batch.append((line, row))
+        if len(batch) >= batch_size:
+            created += _import_batch(db, batch, mark_verified, hash_workers, result)
+            batch = []
+    if batch:
+        created += _import_batch(db, batch, mark_verified, hash_workers, result)
+
+    result["created"] = len(created)
+    if not mark_verified:
+        result["verification_emails"] = len(created)
+    return result, created
+
+
+def _import_batch(db: Session, batch, mark_verified, hash_workers, result):
+    emails = [row.email for _, row in batch]
+    existing = {email for email, in db.query(User.email).filter(User.email.in_(emails))}
+    fresh = []
+    for line, row in batch:
+        if row.email in existing:
+            result["skipped"].append(_issue(line, row.email, "Already registered"))
+        else:
+            fresh.append((line, row))
+    if not fresh:
+        return []
+
+    # bcrypt dominates an import; only pay for it on users that will be created
+    hashes = hash_passwords([row.password for _, row in fresh], hash_workers)
+    now = datetime.now(timezone.utc)
+    users = [
+        {
+            "id": uuid.uuid4(),
+            "username": row.username,
+            "email": row.email,
+            "hashed_password": hashed,
+            "is_verified": mark_verified,
+            "last_verification_sent": now,
+        }
+        for (_, row), hashed in zip(fresh, hashes)
+    ]
+    # Someone may sign up between the check above and here
+    inserted = set(db.execute(
+        insert(User)
+        .values(users)
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.email)
+    ).scalars())
+
+    created, profiles = [], []
+    for (line, row), user in zip(fresh, users):
+        if row.email not in inserted:
+            result["skipped"].append(_issue(line, row.email, "Already registered"))
+            continue
+        profile = None
+        if row.bio or row.branch or row.hostel or row.interests:
+            profile = {
+                "id": uuid.uuid4(),
+                "user_id": user["id"],
+                "bio": row.bio,
+                "branch": row.branch,
+                "batch": f"Y{BATCH_YEAR.search(row.email).group(1)}",
+                "hostel": row.hostel,
+                "interests": row.interests,
+            }
+            profiles.append(profile)
+        created.append({"user_id": user["id"], "email": row.email, "profile": profile})
+
+    if profiles:
+        db.execute(insert(UserProfile).values(profiles))
+        facet_deltas = {}
+        for profile in profiles:
+            for pair in profile_facet_values(UserProfile(**profile)):
+                facet_deltas[pair] = facet_deltas.get(pair, 0) + 1
+        apply_facet_counts(db, facet_deltas)
+        link_new_profile_tags(db, [(profile["id"], profile["interests"]) for profile in profiles])
+    db.commit()
+    return created
+
+
+def publish_imported(created):
+    """Fold imported profiles into this process's caches and in-memory indexes."""
+    for entry in created:
+        profile = entry["profile"]
+        if profile:
+            interest_index.update(entry["user_id"], profile["interests"], profile["branch"], profile["hostel"])
+            names = profile_tag_names(profile["interests"])
+            tag_index.apply((), names, names)
+    if created:
+        response_cache.invalidate(PROFILE_LIST_TAG)
+
+
+async def send_verification_emails(emails, dispatcher=None):
+    """Queue a verification mail per address, waiting whenever the mail queue is full."""
+    dispatcher = dispatcher or email_utils.dispatcher
+    expires = timedelta(hours=IMPORT_VERIFICATION_HOURS)
+    for email in emails:
+        token = create_access_token({"sub": email}, expires_delta=expires)
+        await dispatcher.put(email_utils.build_verification_email(email, token))
+
+
+def _csv_chunk(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _csv_row(profile):
+    user = profile["user"]
+    return (
+        user["id"], user["email"], user["username"], user["is_verified"],
+        profile["id"], profile["bio"], profile["branch"], profile["batch"], profile["hostel"],
+        "; ".join(profile["interests"] or []),
+        " ".join(image["image_url"] for image in user["images"]),
+    )
+
+
+def export_profiles(fmt: str = "jsonl", chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Every profile with its user and images, as encoded JSONL (shaped like
+    UserProfileWithUser) or CSV chunks. Rows come off a server-side cursor
+    `chunk_size` at a time with one image query per chunk, so memory stays
+    flat however large the directory is.
+    """
+    with SessionLocal() as db:
+        result = db.execute(select_profile_rows().order_by(UserProfile.id).execution_options(stream_results=True))
+        if fmt == "csv":
+            yield _csv_chunk([EXPORT_CSV_FIELDS])
+        for rows in result.partitions(chunk_size):
+            image_rows = db.execute(select_image_rows([row.user_id for row in rows])).all()
+            profiles = build_profile_dicts(rows, image_rows)
+            if fmt == "csv":
+                yield _csv_chunk(_csv_row(profile) for profile in profiles)
+            else:
+                yield b"".join(dumps(profile) + b"\n" for profile in profiles)
+
+
+async def _mail(emails):
+    await email_utils.dispatcher.start()
+    await send_verification_emails(emails)
+    await email_utils.dispatcher.stop(timeout=None)
+
+
+def _format_of(args):
+    return args.format or ("csv" if args.path.endswith(".csv") else "jsonl")
+
+
+def run_import(args):
+    with open(args.path, encoding="utf-8-sig", newline="") as f, SessionLocal() as db:
+        result, created = import_users(db, read_records(f, _format_of(args)), args.verified, hash_workers=args.workers)
+    if result["verification_emails"]:
+        asyncio.run(_mail([entry["email"] for entry in created]))
+
+    for kind in ("skipped", "errors"):
+        for issue in result[kind]:
+            print(f"line {issue['line']}: {issue['email'] or '-'}: {issue['detail']}", file=sys.stderr)
+    print(
+        f"Created {result['created']} users, sent {result['verification_emails']} verification mails, "
+        f"skipped {len(result['skipped'])}, rejected {len(result['errors'])}"
+    )
+
+
+def run_export(args):
+    out = sys.stdout.buffer if args.path == "-" else open(args.path, "wb")
+    try:
+        for chunk in export_profiles(_format_of(args)):
+            out.write(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="create users and profiles from a file")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    import_parser.add_argument("--verified", action="store_true", help="mark users verified and send no mail")
+    import_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="password hashing threads")
+    import_parser.set_defaults(run=run_import)
+
+    export_parser = commands.add_parser("export", help="write every profile with its images")
+    export_parser.add_argument("path", help="output file, or - for stdout")
+    export_parser.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    export_parser.set_defaults(run=run_export)
+
+    args = parser.parse_args()
+    args.run(args)
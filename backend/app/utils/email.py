@@ -1,8 +1,11 @@
+import asyncio
 import os
 import aiosmtplib
 from email.message import EmailMessage
 from email.utils import formataddr
 
+from app.utils.metrics import timed
+
 SMTP_HOST = os.getenv("SMTP_HOST")
 SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
 SMTP_USER = os.getenv("SMTP_USER")
@@ -10,7 +13,14 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 FROM_EMAIL = os.getenv("FROM_EMAIL", SMTP_USER)
 FRONTEND_URL = os.getenv("FRONTEND_URL")
 
-async def send_verification_email(to_email: str, token: str):
+EMAIL_QUEUE_SIZE = int(os.getenv("EMAIL_QUEUE_SIZE", 1000))
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 20))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", 5))
+EMAIL_RETRY_BACKOFF = float(os.getenv("EMAIL_RETRY_BACKOFF", 2))  # seconds, doubled per attempt
+EMAIL_IDLE_TIMEOUT = float(os.getenv("EMAIL_IDLE_TIMEOUT", 60))  # close the SMTP session after this long idle
+
+
+def build_verification_email(to_email: str, token: str):
     verify_url = f"{FRONTEND_URL}/verify-email?token={token}"
 
     message = EmailMessage()
@@ -37,12 +47,173 @@ async def send_verification_email(to_email: str, token: str):
         """,
         subtype="html"
     )
+    return message
+
+
+async def record_dead_letter(message: EmailMessage, attempts: int, error: Exception):
+    """Default dead-letter sink: persist the message so it can be inspected and re-sent."""
+    from app.database import AsyncSessionLocal
+    from app.models import EmailDeadLetter
+
+    async with AsyncSessionLocal() as db:
+        db.add(EmailDeadLetter(
+            to_email=message["To"],
+            subject=message["Subject"],
+            message=message.as_string(),
+            error=repr(error)[:1000],
+            attempts=attempts,
+        ))
+        await db.commit()
+
+
+class EmailDispatcher:
+    """
+    In-process mail queue. Requests enqueue and return; a single worker sends
+    in batches over one reused SMTP session, retries failures with exponential
+    backoff and hands messages that exhaust their attempts to `dead_letter`.
+    """
 
-    await aiosmtplib.send(
-        message,
+    def __init__(
+        self,
         hostname=SMTP_HOST,
         port=SMTP_PORT,
-        start_tls=True,
         username=SMTP_USER,
         password=SMTP_PASSWORD,
-    )
+        start_tls=True,
+        queue_size=EMAIL_QUEUE_SIZE,
+        batch_size=EMAIL_BATCH_SIZE,
+        max_attempts=EMAIL_MAX_ATTEMPTS,
+        backoff=EMAIL_RETRY_BACKOFF,
+        idle_timeout=EMAIL_IDLE_TIMEOUT,
+        dead_letter=record_dead_letter,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.idle_timeout = idle_timeout
+        self.dead_letter = dead_letter
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._smtp = None
+        self._worker = None
+        self._retries = set()
+
+    def enqueue(self, message: EmailMessage):
+        """Queue a message for delivery. Raises asyncio.QueueFull when saturated."""
+        self.queue.put_nowait((message, 1))
+
+    async def put(self, message: EmailMessage):
+        """Queue a message, waiting for room instead of raising. For bulk senders."""
+        await self.queue.put((message, 1))
+
+    async def start(self):
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10):
+        """Try to flush queued and retrying mail, then shut the worker down."""
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        for task in [self._worker, *self._retries]:
+            if task:
+                task.cancel()
+        self._worker = None
+        await self._disconnect()
+
+    async def _drain(self):
+        while True:
+            await self.queue.join()
+            if not self._retries:
+                return
+            await asyncio.gather(*self._retries, return_exceptions=True)
+
+    async def _run(self):
+        while True:
+            try:
+                first = await asyncio.wait_for(self.queue.get(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                await self._disconnect()
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            for message, attempt in batch:
+                try:
+                    await self._send(message)
+                except Exception as e:
+                    await self._retry_or_dead_letter(message, attempt, e)
+                finally:
+                    self.queue.task_done()
+
+    async def _connection(self):
+        if self._smtp is None or not self._smtp.is_connected:
+            smtp = aiosmtplib.SMTP(hostname=self.hostname, port=self.port, start_tls=self.start_tls)
+            with timed("smtp", "connect"):
+                await smtp.connect()
+                if self.username:
+                    await smtp.login(self.username, self.password)
+            self._smtp = smtp
+        return self._smtp
+
+    async def _disconnect(self):
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None and smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+
+    async def _send(self, message: EmailMessage):
+        smtp = await self._connection()
+        try:
+            with timed("smtp", "send_message"):
+                await smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Server dropped the idle session; reconnect once and resend
+            self._smtp = None
+            smtp = await self._connection()
+            with timed("smtp", "send_message"):
+                await smtp.send_message(message)
+        except aiosmtplib.SMTPResponseException:
+            raise
+        except Exception:
+            await self._disconnect()
+            raise
+
+    async def _retry_or_dead_letter(self, message: EmailMessage, attempt: int, error: Exception):
+        if attempt >= self.max_attempts:
+            try:
+                await self.dead_letter(message, attempt, error)
+            except Exception as e:
+                print(f"[Email Dead Letter Error] Failed to record mail to {message['To']}: {e}")
+            return
+
+        async def retry():
+            await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            await self.queue.put((message, attempt + 1))
+
+        task = asyncio.create_task(retry())
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+
+dispatcher = EmailDispatcher()
+
+
+def set_dispatcher(new_dispatcher):
+    """Swap the dispatcher (e.g. a local stand-in for load tests) before startup."""
+    global dispatcher
+    dispatcher = new_dispatcher
+
+
+def queue_verification_email(to_email: str, token: str):
+    """Queue a verification mail. Raises asyncio.QueueFull when the queue is saturated."""
+    dispatcher.enqueue(build_verification_email(to_email, token))
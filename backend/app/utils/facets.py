@@ -0,0 +1,95 @@
+import hashlib
+import json
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import FacetCount, UserProfile
+from app.utils.tags import profile_tag_names
+
+FACET_DIMENSIONS = ("branch", "hostel", "batch", "interests")
+
+
+def profile_facet_values(profile):
+    """
+    Set of (dimension, value) pairs a profile contributes to the facet catalog.
+    Interests are counted by tag slug, so "ML" and "Machine Learning" are one
+    value, the same one the interests filter matches on.
+    Pass None for a profile that does not exist (yet / any more).
+    """
+    if profile is None:
+        return set()
+    values = set()
+    for dimension in ("branch", "hostel", "batch"):
+        value = getattr(profile, dimension)
+        if value:
+            values.add((dimension, value))
+    for slug in profile_tag_names(profile.interests):
+        values.add(("interests", slug))
+    return values
+
+
+def apply_facet_delta(db: Session, before: set, after: set):
+    """
+    Move the catalog from a profile's old facet values to its new ones.
+    Runs inside the caller's transaction; does not commit.
+    """
+    deltas = {pair: -1 for pair in before - after}
+    deltas.update({pair: 1 for pair in after - before})
+    apply_facet_counts(db, deltas)
+
+
+def apply_facet_counts(db: Session, deltas: dict):
+    """
+    Add a signed count per (dimension, value) pair, e.g. summed over many
+    profiles removed at once. Runs inside the caller's transaction.
+    """
+    deltas = {pair: delta for pair, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    for (dimension, value), delta in deltas.items():
+        stmt = insert(FacetCount).values(dimension=dimension, value=value, count=max(delta, 0))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FacetCount.dimension, FacetCount.value],
+            set_={"count": FacetCount.count + delta},
+        )
+        db.execute(stmt)
+
+    db.query(FacetCount).filter(FacetCount.count <= 0).delete(synchronize_session=False)
+
+
+def rebuild_facet_counts(db: Session):
+    """
+    Recompute the whole catalog from user_profiles, e.g. after editing
+    profiles by hand. Normal writes go through apply_facet_delta.
+    """
+    totals = {}
+    for profile in db.query(UserProfile).yield_per(1000):
+        for pair in profile_facet_values(profile):
+            totals[pair] = totals.get(pair, 0) + 1
+
+    db.query(FacetCount).delete(synchronize_session=False)
+    db.add_all(
+        FacetCount(dimension=dimension, value=value, count=count)
+        for (dimension, value), count in totals.items()
+    )
+    db.commit()
+
+
+def load_facet_catalog(db: Session):
+    """
+    Read the catalog as {dimension: [{"value", "count"}, ...]} with an ETag
+    derived from its contents.
+    """
+    catalog = {dimension: [] for dimension in FACET_DIMENSIONS}
+    rows = (
+        db.query(FacetCount.dimension, FacetCount.value, FacetCount.count)
+        .order_by(FacetCount.dimension, FacetCount.count.desc(), FacetCount.value)
+        .all()
+    )
+    for dimension, value, count in rows:
+        catalog.setdefault(dimension, []).append({"value": value, "count": count})
+
+    digest = hashlib.sha1(json.dumps(catalog, sort_keys=True).encode()).hexdigest()
+    return catalog, f'"{digest}"'
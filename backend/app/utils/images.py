@@ -0,0 +1,81 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.database import SessionLocal
+from app.models import UserImage
+from app.utils.response_cache import invalidate_profile_responses
+from app.utils.s3 import get_s3_object_bytes, put_s3_object, s3_public_url
+
+# name -> longest edge in pixels
+IMAGE_VARIANTS = {"thumbnail": 320, "medium": 1080}
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+WEBP_QUALITY = 80
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+    return _executor
+
+
+def make_variants(data: bytes):
+    """
+    Resize an uploaded image into every IMAGE_VARIANTS size as WebP.
+    CPU-bound; runs in the process pool.
+    :return: Dict of variant name -> WebP bytes
+    """
+    # Imported here so Pillow only loads in the worker processes
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    variants = {}
+    for name, edge in IMAGE_VARIANTS.items():
+        resized = image.copy()
+        resized.thumbnail((edge, edge), Image.LANCZOS)
+        out = io.BytesIO()
+        resized.save(out, format="WEBP", quality=WEBP_QUALITY, method=4)
+        variants[name] = out.getvalue()
+    return variants
+
+
+def variant_key(image_key: str, name: str):
+    base = image_key.rsplit(".", 1)[0]
+    return f"variants/{name}/{base}.webp"
+
+
+def process_image_variants(image_ids):
+    """
+    Build and upload resized variants for the given UserImage rows and record
+    them. Run as a background task after the images are saved.
+    """
+    with SessionLocal() as db:
+        images = db.query(UserImage).filter(UserImage.id.in_(list(image_ids))).all()
+        pending = {}
+        for image in images:
+            try:
+                data = get_s3_object_bytes(image.image_key)
+            except Exception as e:
+                print(f"[Image Pipeline Error] Failed to fetch {image.image_key}: {e}")
+                continue
+            pending[image] = _get_executor().submit(make_variants, data)
+
+        for image, future in pending.items():
+            try:
+                variants = future.result()
+                for name, data in variants.items():
+                    key = variant_key(image.image_key, name)
+                    put_s3_object(key, data, "image/webp")
+                    setattr(image, f"{name}_key", key)
+                    setattr(image, f"{name}_url", s3_public_url(key))
+            except Exception as e:
+                print(f"[Image Pipeline Error] Failed to resize {image.image_key}: {e}")
+        db.commit()
+
+        for user in {image.user for image in images}:
+            invalidate_profile_responses(user.id, user.club_role)
@@ -0,0 +1,269 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.pool_stats import WAIT_BUCKETS
+
+# Opt-in: log requests slower than this many milliseconds, with their SQL
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", 0))
+SLOW_REQUEST_STATEMENTS = 5
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram with a fixed set of label names."""
+
+    def __init__(self, name: str, help: str, buckets, labelnames=()):
+        self.name = name
+        self.help = help
+        self.bounds = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        self._series = {}  # label values -> [bucket counts, count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * len(self.bounds), 0, 0.0]
+            for i, bound in enumerate(self.bounds):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += 1
+            series[2] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(self._series.items())
+            for labelvalues, (buckets, count, total) in series:
+                labels = list(zip(self.labelnames, labelvalues))
+                for bound, n in zip(self.bounds, buckets):
+                    lines.append(f"{self.name}_bucket{_labels(labels + [('le', bound)])} {n}")
+                lines.append(f"{self.name}_bucket{_labels(labels + [('le', '+Inf')])} {count}")
+                lines.append(f"{self.name}_count{_labels(labels)} {count}")
+                lines.append(f"{self.name}_sum{_labels(labels)} {total}")
+        return lines
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Request latency by route.",
+    LATENCY_BUCKETS, ("method", "route", "status"),
+)
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.",
+    QUERY_COUNT_BUCKETS, ("method", "route"),
+)
+request_db_time = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per request.",
+    LATENCY_BUCKETS, ("method", "route"),
+)
+query_latency = Histogram("db_query_duration_seconds", "Latency of single SQL statements.", LATENCY_BUCKETS)
+external_latency = Histogram(
+    "external_call_duration_seconds", "Latency of outbound S3 and SMTP calls.",
+    LATENCY_BUCKETS, ("service", "operation", "outcome"),
+)
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements = []  # (seconds, sql), only kept for the slow-request log
+
+
+_request_stats = ContextVar("request_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    query_latency.observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if SLOW_REQUEST_MS:
+            stats.statements.append((elapsed, statement))
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is not None and context.connection.info.get("query_start"):
+        context.connection.info["query_start"].pop()
+
+
+@contextmanager
+def timed(service: str, operation: str):
+    """Record the duration and outcome of an outbound call."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        external_latency.observe(time.perf_counter() - start, service, operation, outcome)
+
+
+def instrument_s3_client(client):
+    """Time every S3 API call made through `client`, retries included."""
+    def before_call(model, context, **kwargs):
+        context["metrics_call"] = (model.name, time.perf_counter())
+
+    def after_call(context, outcome="ok", **kwargs):
+        call = context.pop("metrics_call", None)
+        if call is not None:
+            operation, start = call
+            external_latency.observe(time.perf_counter() - start, "s3", operation, outcome)
+
+    def after_call_error(context, **kwargs):
+        after_call(context, "error")
+
+    client.meta.events.register("before-call.s3", before_call)
+    client.meta.events.register("after-call.s3", after_call)
+    client.meta.events.register("after-call-error.s3", after_call_error)
+    return client
+
+
+def _route_template(scope):
+    """Path template of the matched route, so /profile/x/1 and /x/2 share a series."""
+    from starlette.routing import Match
+
+    if scope.get("route") is not None:
+        return scope["route"].path
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", scope["path"])
+    return "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Times every HTTP request and counts the SQL it ran. Requests slower than
+    SLOW_REQUEST_MS are logged with their slowest statements.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        observed = False
+        start = time.perf_counter()
+
+        def observe():
+            nonlocal observed
+            observed = True
+            elapsed = time.perf_counter() - start
+            method, route = scope["method"], _route_template(scope)
+            request_latency.observe(elapsed, method, route, status)
+            request_queries.observe(stats.queries, method, route)
+            request_db_time.observe(stats.db_seconds, method, route)
+            if SLOW_REQUEST_MS and elapsed * 1000 >= SLOW_REQUEST_MS:
+                _log_slow_request(scope, route, status, elapsed, stats)
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            # Stop at the last body chunk; BackgroundTasks run after it but
+            # inside self.app, and must not count towards the route's latency
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not observed:
+                observe()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _request_stats.reset(token)
+            if not observed:
+                observe()
+
+
+def _log_slow_request(scope, route, status, elapsed, stats):
+    slowest = sorted(stats.statements, key=lambda item: item[0], reverse=True)[:SLOW_REQUEST_STATEMENTS]
+    # One JSON object per line, which Cloud Logging picks up as a structured entry
+    print(json.dumps({
+        "severity": "WARNING",
+        "message": f"Slow request {scope['method']} {scope['path']}",
+        "route": route,
+        "status": status,
+        "duration_ms": round(elapsed * 1000, 1),
+        "db_queries": stats.queries,
+        "db_ms": round(stats.db_seconds * 1000, 1),
+        "slowest_sql": [{"ms": round(seconds * 1000, 1), "sql": sql[:1000]} for seconds, sql in slowest],
+    }))
+
+
+def _pool_lines(engines):
+    lines = [
+        "# HELP db_pool_checked_out Connections currently checked out of the pool.",
+        "# TYPE db_pool_checked_out gauge",
+    ]
+    for label, pool_engine in engines.items():
+        lines.append(f'db_pool_checked_out{{engine="{label}"}} {pool_engine.pool.checkedout()}')
+    lines += [
+        "# HELP db_pool_overflow Connections open beyond the pool size.",
+        "# TYPE db_pool_overflow gauge",
+    ]
+    for label, pool_engine in engines.items():
+        lines.append(f'db_pool_overflow{{engine="{label}"}} {pool_engine.pool.overflow()}')
+    lines += [
+        "# HELP db_pool_wait_seconds Time spent waiting for a pooled connection.",
+        "# TYPE db_pool_wait_seconds histogram",
+    ]
+    timeouts = []
+    for label, pool_engine in engines.items():
+        wait = pool_engine.pool.wait_histogram.snapshot()
+        for bound in WAIT_BUCKETS:
+            lines.append(f'db_pool_wait_seconds_bucket{{engine="{label}",le="{bound}"}} {wait["buckets"][str(bound)]}')
+        lines.append(f'db_pool_wait_seconds_bucket{{engine="{label}",le="+Inf"}} {wait["count"]}')
+        lines.append(f'db_pool_wait_seconds_count{{engine="{label}"}} {wait["count"]}')
+        lines.append(f'db_pool_wait_seconds_sum{{engine="{label}"}} {wait["sum"]}')
+        timeouts.append(f'db_pool_timeouts_total{{engine="{label}"}} {wait["timeouts"]}')
+    lines += [
+        "# HELP db_pool_timeouts_total Checkouts that gave up waiting for a connection.",
+        "# TYPE db_pool_timeouts_total counter",
+        *timeouts,
+    ]
+    return lines
+
+
+def render_metrics(engines):
+    """Everything above in the Prometheus text exposition format."""
+    lines = []
+    for histogram in (request_latency, request_queries, request_db_time, query_latency, external_latency):
+        lines += histogram.render()
+    lines += _pool_lines(engines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+
+
+def encode_keyset(*values) -> str:
+    """
+    Build an opaque keyset cursor from the sort key of the last row of a page.
+    UUIDs and datetimes are stored as strings; decode_keyset's `types` restores them.
+    :return: URL-safe string to pass back as `cursor`
+    """
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":"),
+        default=str,
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset(cursor: str, *types):
+    """
+    Inverse of encode_keyset.
+    :param types: One converter per value (e.g. str, UUID, datetime.fromisoformat)
+    :return: Tuple of converted values
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    # A crafted cursor can put any JSON value in any slot, e.g. UUID(2) raises AttributeError
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_cursor(username: str, user_id: UUID) -> str:
+    """
+    Cursor for the profile directory, keyed on (username, user id).
+    :param username: Username of the last profile's user
+    :param user_id: UUID of the last profile's user (tie-breaker)
+    """
+    return encode_keyset(username, user_id)
+
+
+def decode_cursor(cursor: str):
+    """
+    Inverse of encode_cursor.
+    :return: Tuple of (username, user_id)
+    """
+    return decode_keyset(cursor, str, UUID)
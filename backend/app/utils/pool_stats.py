@@ -0,0 +1,83 @@
+import time
+import threading
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class PoolWaitHistogram:
+    """Cumulative histogram of how long callers waited for a pooled connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = [0] * len(WAIT_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.sum += seconds
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.buckets[i] += 1
+
+    def timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "buckets": {str(bound): n for bound, n in zip(WAIT_BUCKETS, self.buckets)},
+                "count": self.count,
+                "sum": self.sum,
+                "timeouts": self.timeouts,
+            }
+
+
+class _TimedPoolMixin:
+    """Records checkout wait times on the pool's `wait_histogram`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = PoolWaitHistogram()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_histogram = self.wait_histogram
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_histogram.timeout()
+            raise
+        self.wait_histogram.observe(time.perf_counter() - start)
+        return conn
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(engine):
+    """Live occupancy and wait-time statistics for an engine's pool."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "wait_seconds": pool.wait_histogram.snapshot(),
+    }
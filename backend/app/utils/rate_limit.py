@@ -0,0 +1,183 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+RATE_LIMIT_URL = os.getenv("RATE_LIMIT_URL") or os.getenv("USER_CACHE_URL")  # e.g. redis://host:6379/0
+RATE_LIMIT_SIZE = int(os.getenv("RATE_LIMIT_SIZE", 100000))
+# Proxies in front of the app that append to X-Forwarded-For (1 on Cloud Run)
+RATE_LIMIT_PROXY_HOPS = int(os.getenv("RATE_LIMIT_PROXY_HOPS", 1))
+# Bodies larger than this are not parsed for an email; the IP limit still applies
+MAX_BODY_BYTES = 64 * 1024
+
+
+def _rule(name: str, default: str):
+    """"<requests>/<seconds>" from the environment, as (bucket capacity, tokens per second)."""
+    count, seconds = os.getenv(name, default).split("/")
+    return int(count), int(count) / float(seconds)
+
+
+# POST path -> (per-IP rule, per-email rule). Hostels share a handful of
+# campus NAT addresses, so the IP limits are deliberately loose.
+RATE_LIMITS = {
+    "/auth/login": (_rule("RATE_LIMIT_LOGIN_IP", "60/60"), _rule("RATE_LIMIT_LOGIN_EMAIL", "10/300")),
+    "/auth/signup": (_rule("RATE_LIMIT_SIGNUP_IP", "30/300"), _rule("RATE_LIMIT_SIGNUP_EMAIL", "3/3600")),
+    "/auth/resend-verification": (
+        _rule("RATE_LIMIT_RESEND_IP", "30/300"),
+        _rule("RATE_LIMIT_RESEND_EMAIL", "3/3600"),
+    ),
+}
+
+
+class MemoryRateLimiter:
+    """Per-process token buckets. Also the stand-in for the shared backend in tests."""
+
+    def __init__(self, maxsize: int = RATE_LIMIT_SIZE):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, capacity: int, rate: float):
+        """Take one token. Returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+# Same bucket as MemoryRateLimiter.hit, atomically on the Redis server's clock
+_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimiter:
+    """Buckets shared by every instance, so limits hold however far the service scales."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis.asyncio as redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._script = self.client.register_script(_TOKEN_BUCKET)
+
+    async def hit(self, key: str, capacity: int, rate: float):
+        try:
+            retry_after = await self._script(keys=[self.prefix + key], args=[capacity, rate])
+        except Exception as e:
+            # Fail open: an outage of the limiter must not lock everyone out
+            print(f"[Rate Limit Error] {e!r}")
+            return 0.0
+        return float(retry_after)
+
+
+_limiter = RedisRateLimiter(RATE_LIMIT_URL) if RATE_LIMIT_URL else MemoryRateLimiter()
+
+
+def set_rate_limiter(limiter):
+    """Swap the limiter backend (e.g. a MemoryRateLimiter in tests)."""
+    global _limiter
+    _limiter = limiter
+
+
+def client_ip(scope):
+    """
+    Address of the caller. Behind RATE_LIMIT_PROXY_HOPS proxies that is the
+    entry they appended to X-Forwarded-For; anything left of it is client-supplied.
+    """
+    if RATE_LIMIT_PROXY_HOPS:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                hops = [hop.strip() for hop in value.decode("latin-1").split(",")]
+                if len(hops) >= RATE_LIMIT_PROXY_HOPS:
+                    return hops[-RATE_LIMIT_PROXY_HOPS]
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _email_from(body: bytes):
+    try:
+        email = json.loads(body).get("email")
+    except (ValueError, AttributeError):
+        return None
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+class RateLimitMiddleware:
+    """
+    Token buckets per client IP and per submitted email on the auth
+    endpoints in RATE_LIMITS. Runs before routing, so a rejected request
+    never reaches the database, bcrypt or SMTP.
+    """
+
+    def __init__(self, app, limits=None):
+        self.app = app
+        self.limits = RATE_LIMITS if limits is None else limits
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.limits:
+            return await self.app(scope, receive, send)
+
+        ip_rule, email_rule = self.limits[scope["path"]]
+        retry_after = await _limiter.hit(f"ip:{scope['path']}:{client_ip(scope)}", *ip_rule)
+        if retry_after:
+            return await self._reject(send, retry_after)
+
+        # Read the (small) body to find the email, then replay it to the app
+        messages, body, more = [], b"", True
+        while more and len(body) <= MAX_BODY_BYTES:
+            message = await receive()
+            messages.append(message)
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        email = None if more else _email_from(body)
+        if email:
+            retry_after = await _limiter.hit(f"email:{scope['path']}:{email}", *email_rule)
+            if retry_after:
+                return await self._reject(send, retry_after)
+
+        async def replay():
+            return messages.pop(0) if messages else await receive()
+
+        await self.app(scope, replay, send)
+
+    async def _reject(self, send, retry_after: float):
+        body = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,157 @@
+import asyncio
+import heapq
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UserProfile
+from app.utils.tags import normalize_tag
+
+# Full rebuild interval; bounds how stale another worker's writes can look here
+RECOMMENDATION_INDEX_TTL = int(os.getenv("RECOMMENDATION_INDEX_TTL", 900))
+# Added on top of the interest similarity, which is in [0, 1]
+SAME_HOSTEL_BONUS = float(os.getenv("RECOMMENDATION_HOSTEL_BONUS", 0.15))
+SAME_BRANCH_BONUS = float(os.getenv("RECOMMENDATION_BRANCH_BONUS", 0.1))
+# Tags listed by more users than this only re-rank candidates found through
+# rarer tags instead of pulling in their whole posting list
+MAX_CANDIDATE_POSTINGS = int(os.getenv("RECOMMENDATION_MAX_POSTINGS", 1000))
+
+
+def normalize_interests(interests):
+    """Set of tag slugs for a profile's interests, as stored in interest_tags."""
+    return frozenset(filter(None, map(normalize_tag, interests or [])))
+
+
+class InterestIndex:
+    """
+    Inverted index from interest tag to the user ids that list it, kept in
+    memory and updated on every profile write. Recommendations only score
+    users sharing at least one tag with the viewer, never the whole table.
+
+    Interest similarity is a weighted Jaccard where each tag weighs its
+    smoothed IDF, so sharing a niche interest counts for more than sharing
+    "music". Same hostel / branch add a fixed bonus.
+    """
+
+    def __init__(self, ttl: int = RECOMMENDATION_INDEX_TTL):
+        self.ttl = ttl
+        self._users_by_tag = defaultdict(set)
+        self._profiles = {}  # user_id -> (tags, branch, hostel)
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def is_stale(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def load(self, rows):
+        """Replace the index with (user_id, interests, branch, hostel) rows."""
+        users_by_tag = defaultdict(set)
+        profiles = {}
+        for user_id, interests, branch, hostel in rows:
+            tags = normalize_interests(interests)
+            profiles[user_id] = (tags, branch, hostel)
+            for tag in tags:
+                users_by_tag[tag].add(user_id)
+
+        with self._lock:
+            self._users_by_tag = users_by_tag
+            self._profiles = profiles
+            self._loaded_at = time.monotonic()
+
+    def update(self, user_id, interests, branch, hostel):
+        """Apply one profile write. A no-op until the index is first loaded."""
+        tags = normalize_interests(interests)
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._unlink(user_id)
+            self._profiles[user_id] = (tags, branch, hostel)
+            for tag in tags:
+                self._users_by_tag[tag].add(user_id)
+
+    def remove(self, user_id):
+        with self._lock:
+            self._unlink(user_id)
+
+    def _unlink(self, user_id):
+        entry = self._profiles.pop(user_id, None)
+        if entry is None:
+            return
+        for tag in entry[0]:
+            users = self._users_by_tag.get(tag)
+            if users is not None:
+                users.discard(user_id)
+                if not users:
+                    del self._users_by_tag[tag]
+
+    def _idf(self, tag, total):
+        return math.log((1 + total) / (1 + len(self._users_by_tag.get(tag, ())))) + 1
+
+    def recommend(self, user_id, interests, branch, hostel, limit: int = 10):
+        """
+        Top `limit` other users for a viewer with the given profile, as
+        (user_id, score, shared_tags) tuples, best first.
+        """
+        tags = normalize_interests(interests)
+        with self._lock:
+            total = len(self._profiles)
+            idf = {}
+
+            def weight(tag):
+                if tag not in idf:
+                    idf[tag] = self._idf(tag, total)
+                return idf[tag]
+
+            viewer_weight = sum(weight(tag) for tag in tags)
+
+            # Only users reachable through the viewer's own tags are scored,
+            # walking the rarest (most telling) tags first
+            overlap = defaultdict(float)
+            for tag in sorted(tags, key=weight, reverse=True):
+                users = self._users_by_tag.get(tag, ())
+                if len(users) > MAX_CANDIDATE_POSTINGS and len(overlap) > limit:
+                    for other in overlap:
+                        if other in users:
+                            overlap[other] += weight(tag)
+                else:
+                    for other in users:
+                        overlap[other] += weight(tag)
+            overlap.pop(user_id, None)
+
+            scored = []
+            for other, shared_weight in overlap.items():
+                other_tags, other_branch, other_hostel = self._profiles[other]
+                other_weight = sum(weight(tag) for tag in other_tags)
+                score = shared_weight / (viewer_weight + other_weight - shared_weight)
+                if hostel and other_hostel == hostel:
+                    score += SAME_HOSTEL_BONUS
+                if branch and other_branch == branch:
+                    score += SAME_BRANCH_BONUS
+                scored.append((score, other))
+
+            best = heapq.nlargest(limit, scored, key=lambda item: item[0])
+            return [
+                (other, score, tags & self._profiles[other][0])
+                for score, other in best
+            ]
+
+
+interest_index = InterestIndex()
+_load_lock = asyncio.Lock()
+
+
+async def ensure_interest_index(db: AsyncSession):
+    """(Re)build the index from user_profiles when it is missing or past its TTL."""
+    if not interest_index.is_stale():
+        return
+    async with _load_lock:
+        if not interest_index.is_stale():
+            return
+        stmt = select(UserProfile.user_id, UserProfile.interests, UserProfile.branch, UserProfile.hostel)
+        rows = (await db.execute(stmt)).all()
+        interest_index.load(rows)
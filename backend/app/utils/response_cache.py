@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from fastapi import Request, Response
+
+from app.utils.serialization import dumps
+
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", 2048))
+# Invalidations are broadcast to every instance over this Redis (pub/sub)
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL") or os.getenv("USER_CACHE_URL")
+RESPONSE_CACHE_CHANNEL = "response-cache:invalidate"
+
+# Browsers may store the body but must revalidate it with If-None-Match
+CACHE_CONTROL = "no-cache"
+
+
+class CachedResponse:
+    def __init__(self, body: bytes, tags, ttl: int):
+        self.body = body
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.tags = tuple(tags)
+        self.expires_at = time.monotonic() + ttl
+
+    def to_response(self, request: Request):
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class RedisInvalidationBus:
+    """Fans tag invalidations out to every instance's cache over Redis pub/sub."""
+
+    def __init__(self, url: str, channel: str = RESPONSE_CACHE_CHANNEL):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.channel = channel
+        self._thread = None
+
+    def publish(self, tags):
+        try:
+            self.client.publish(self.channel, json.dumps(list(tags)))
+        except Exception as e:
+            # Other instances stay stale for at most the TTL
+            print(f"[Response Cache Error] Failed to broadcast invalidation: {e!r}")
+
+    def listen(self, on_tags):
+        if self._thread is not None:
+            return
+
+        def on_error(e, pubsub, thread):
+            # The next poll reconnects and resubscribes
+            print(f"[Response Cache Error] Invalidation listener: {e!r}")
+            time.sleep(1)
+
+        try:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: lambda message: on_tags(json.loads(message["data"]))})
+            self._thread = pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=on_error)
+        except Exception as e:
+            # Redis down at startup must not stop the app; entries from other
+            # instances' writes then expire with the TTL
+            print(f"[Response Cache Error] Failed to subscribe to invalidations: {e!r}")
+
+    def stop(self):
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.stop()
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of serialized JSON responses. Each entry carries tags
+    (e.g. "profile:<user_id>") so writes can evict exactly what they affect.
+    Entries are per process. With a `bus`, invalidations reach every
+    instance within milliseconds; without one, other instances converge
+    within the TTL.
+    """
+
+    def __init__(self, ttl: int = RESPONSE_CACHE_TTL, maxsize: int = RESPONSE_CACHE_SIZE, bus=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.bus = bus
+        self._entries = OrderedDict()
+        self._keys_by_tag = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: str, data, tags):
+        """Serialize `data` like FastAPI would and cache it under `key`."""
+        body = dumps(data)
+        entry = CachedResponse(body, tags, self.ttl)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._keys_by_tag[tag].add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self, *tags):
+        """Evict entries carrying any of `tags` here and, with a bus, on every other instance."""
+        self._invalidate_local(tags)
+        if self.bus is not None:
+            self.bus.publish(tags)
+
+    def start_listening(self):
+        """Apply invalidations broadcast by other instances. Call once at startup."""
+        if self.bus is not None:
+            self.bus.listen(self._invalidate_local)
+
+    def stop_listening(self):
+        if self.bus is not None:
+            self.bus.stop()
+
+    def _invalidate_local(self, tags):
+        with self._lock:
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+response_cache = ResponseCache(bus=RedisInvalidationBus(RESPONSE_CACHE_URL) if RESPONSE_CACHE_URL else None)
+
+PROFILE_LIST_TAG = "profiles:list"
+CLUB_MEMBERS_TAG = "club-members"
+
+
+def profile_tag(user_id):
+    return f"profile:{user_id}"
+
+
+def invalidate_profile_responses(user_id, club_role=None):
+    """Evict every cached response that can include this user's profile."""
+    tags = [profile_tag(user_id), PROFILE_LIST_TAG]
+    if club_role:
+        tags.append(CLUB_MEMBERS_TAG)
+    response_cache.invalidate(*tags)
@@ -1,7 +1,12 @@
 import os
-import boto3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from botocore.exceptions import ClientError
 
+from app.utils.metrics import instrument_s3_client
+
 # Load environment variables (optional, if using dotenv)
 from dotenv import load_dotenv
 load_dotenv()
@@ -12,35 +17,88 @@ AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.getenv("AWS_REGION")
 S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 
-# Initialize boto3 S3 client
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_REGION,
-)
+_client_override = None
+
 
+def set_s3_client(client):
+    """Swap the S3 client (e.g. a local stand-in for load tests); None restores boto3."""
+    global _client_override
+    _client_override = client
 
-def generate_presigned_post(key: str, expires_in: int = 3600):
+
+def get_s3_client():
+    """
+    Shared boto3 S3 client, built on first use rather than at import so it
+    stays off the cold-start path. boto3 clients are thread-safe.
+    """
+    if _client_override is not None:
+        return _client_override
+    return _build_s3_client()
+
+
+@lru_cache(maxsize=None)
+def _build_s3_client():
+    import boto3
+
+    return instrument_s3_client(boto3.client(
+        "s3",
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_REGION,
+    ))
+
+
+def s3_public_url(key: str):
+    return f"https://{S3_BUCKET}.s3.{AWS_REGION}.amazonaws.com/{key}"
+
+
+def get_s3_object_bytes(key: str):
+    return get_s3_client().get_object(Bucket=S3_BUCKET, Key=key)["Body"].read()
+
+
+def put_s3_object(key: str, data: bytes, content_type: str):
+    get_s3_client().put_object(
+        Bucket=S3_BUCKET,
+        Key=key,
+        Body=data,
+        ContentType=content_type,
+        CacheControl="public, max-age=31536000, immutable",
+    )
+
+
+# Policy fields and conditions are fixed; build them once
+PRESIGN_FIELDS = {
+    "Content-Type": "image/jpeg",  # or "image/png" depending on file
+    "Content-Disposition": "inline"  # optional, forces view not download
+}
+PRESIGN_CONDITIONS = [
+    ["content-length-range", 0, 10 * 1024 * 1024],
+    {"Content-Type": "image/jpeg"},
+    {"Content-Disposition": "inline"}
+]
+PRESIGN_EXPIRES_IN = 3600
+# Reuse a signed prefix policy for this long; well inside PRESIGN_EXPIRES_IN
+PRESIGN_CACHE_TTL = int(os.getenv("PRESIGN_CACHE_TTL", 300))
+PRESIGN_CACHE_SIZE = 10000
+
+_prefix_policies = OrderedDict()
+_prefix_policies_lock = threading.Lock()
+
+
+def generate_presigned_post(key: str, expires_in: int = PRESIGN_EXPIRES_IN):
     """
     Generate a presigned POST URL for direct upload to S3 from the frontend.
-    :param key: S3 object key (e.g. "user-profiles/123/photo1.jpg")
+    :param key: S3 object key (e.g. "user-profiles/123/photo1.jpg"). A key
+        ending in "${filename}" yields a policy for any key under that prefix.
     :param expires_in: Expiration time in seconds
     :return: Dict with 'url' and 'fields' for HTML form upload
     """
     try:
-        response = s3_client.generate_presigned_post(
+        response = get_s3_client().generate_presigned_post(
             Bucket=S3_BUCKET,
             Key=key,
-            Fields={
-                "Content-Type": "image/jpeg",  # or "image/png" depending on file
-                "Content-Disposition": "inline"  # optional, forces view not download
-            },
-            Conditions=[
-                ["content-length-range", 0, 10 * 1024 * 1024],
-                {"Content-Type": "image/jpeg"},
-                {"Content-Disposition": "inline"}
-            ],
+            Fields=dict(PRESIGN_FIELDS),
+            Conditions=list(PRESIGN_CONDITIONS),
             ExpiresIn=expires_in
         )
 
@@ -49,13 +107,67 @@ def generate_presigned_post(key: str, expires_in: int = 3600):
         raise Exception(f"Error generating presigned URL: {e}")
 
 
+def presign_prefix_upload(prefix: str, filename: str):
+    """
+    Presigned POST for `prefix + filename`, signed with a policy that allows
+    any key under `prefix`. The signed policy is cached per prefix for
+    PRESIGN_CACHE_TTL, so repeat and batch uploads skip re-signing.
+    :return: Dict with 'url', 'fields' and 'key'
+    """
+    now = time.monotonic()
+    with _prefix_policies_lock:
+        cached = _prefix_policies.get(prefix)
+        if cached and cached[0] > now:
+            _prefix_policies.move_to_end(prefix)
+            signed = cached[1]
+        else:
+            signed = None
+
+    if signed is None:
+        signed = generate_presigned_post(prefix + "${filename}")
+        with _prefix_policies_lock:
+            _prefix_policies[prefix] = (now + PRESIGN_CACHE_TTL, signed)
+            _prefix_policies.move_to_end(prefix)
+            while len(_prefix_policies) > PRESIGN_CACHE_SIZE:
+                _prefix_policies.popitem(last=False)
+
+    key = prefix + filename
+    return {"url": signed["url"], "fields": {**signed["fields"], "key": key}, "key": key}
+
+
+# DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
+
 def delete_s3_object(key: str):
     """
     Delete an object from S3 given its object key.
     :param key: S3 object key (e.g. "user-profiles/123/photo1.jpg")
     """
     try:
-        s3_client.delete_object(Bucket=S3_BUCKET, Key=key)
+        get_s3_client().delete_object(Bucket=S3_BUCKET, Key=key)
     except ClientError as e:
         print(f"[S3 Delete Error] Failed to delete {key}: {e}")
 
+
+def delete_s3_objects(keys):
+    """
+    Delete many objects with batched DeleteObjects calls.
+    :param keys: S3 object keys
+    :return: Dict of key -> error message for every key that was not deleted
+    """
+    keys = list(keys)
+    failed = {}
+    for i in range(0, len(keys), DELETE_BATCH_SIZE):
+        chunk = keys[i:i + DELETE_BATCH_SIZE]
+        try:
+            response = get_s3_client().delete_objects(
+                Bucket=S3_BUCKET,
+                Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+            )
+        except ClientError as e:
+            failed.update({key: str(e) for key in chunk})
+            continue
+        for error in response.get("Errors", []):
+            failed[error["Key"]] = error.get("Message") or error.get("Code")
+    return failed
@@ -0,0 +1,80 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import S3Deletion, UserImage
+from app.utils.s3 import DELETE_BATCH_SIZE, delete_s3_objects
+
+S3_DELETE_RETRY_BACKOFF = int(os.getenv("S3_DELETE_RETRY_BACKOFF", 30))  # seconds, doubled per attempt
+S3_DELETE_MAX_BACKOFF = int(os.getenv("S3_DELETE_MAX_BACKOFF", 6 * 60 * 60))
+S3_DELETE_SWEEP_INTERVAL = int(os.getenv("S3_DELETE_SWEEP_INTERVAL", 300))  # seconds
+
+
+def queue_s3_deletions(db: Session, keys):
+    """Record keys for deletion in the caller's transaction; does not commit."""
+    db.add_all(S3Deletion(image_key=key) for key in keys)
+
+
+def cancel_s3_deletions(db: Session, keys):
+    """Drop pending deletions of keys that are in use again; does not commit."""
+    db.query(S3Deletion).filter(S3Deletion.image_key.in_(keys)).delete(synchronize_session=False)
+
+
+def _keys_in_use(db: Session, keys):
+    columns = (UserImage.image_key, UserImage.thumbnail_key, UserImage.medium_key)
+    rows = db.query(*columns).filter(or_(*(column.in_(keys) for column in columns)))
+    return {key for row in rows for key in row if key in keys}
+
+
+def flush_s3_deletions():
+    """
+    Delete every due outbox entry from S3, up to DELETE_BATCH_SIZE keys per call.
+    Rows are claimed with SKIP LOCKED so concurrent flushes never overlap, and
+    failures are pushed back with exponential backoff for a later flush. Keys
+    that an image uses again (e.g. the same file re-uploaded) are dropped from
+    the outbox without touching S3.
+    """
+    with SessionLocal() as db:
+        while True:
+            now = datetime.now(timezone.utc)
+            pending = (
+                db.query(S3Deletion)
+                .filter(S3Deletion.next_attempt_at <= now)
+                .order_by(S3Deletion.next_attempt_at)
+                .limit(DELETE_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not pending:
+                return
+
+            keys = {row.image_key for row in pending}
+            in_use = _keys_in_use(db, keys)
+            failed = delete_s3_objects(keys - in_use)
+            for row in pending:
+                if row.image_key not in failed:
+                    db.delete(row)
+                    continue
+                row.attempts += 1
+                row.last_error = failed[row.image_key][:1000]
+                delay = min(S3_DELETE_RETRY_BACKOFF * 2 ** (row.attempts - 1), S3_DELETE_MAX_BACKOFF)
+                row.next_attempt_at = now + timedelta(seconds=delay)
+                print(f"[S3 Delete Error] Failed to delete {row.image_key} (attempt {row.attempts}): {row.last_error}")
+            db.commit()
+
+
+async def sweep_s3_deletions(interval: int = S3_DELETE_SWEEP_INTERVAL):
+    """
+    Flush the outbox now and then every `interval` seconds, so failed deletes
+    are retried once due instead of waiting for the next image replacement.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(flush_s3_deletions)
+        except Exception as e:
+            print(f"[S3 Delete Error] Outbox sweep failed: {e!r}")
+        await asyncio.sleep(interval)
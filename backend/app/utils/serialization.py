@@ -0,0 +1,103 @@
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager, selectinload
+
+from app.models import ProfileReport, User, UserImage, UserProfile
+
+# Exactly the columns UserProfileWithUser needs, fetched as plain tuples
+PROFILE_COLUMNS = (
+    UserProfile.id,
+    UserProfile.bio,
+    UserProfile.branch,
+    UserProfile.batch,
+    UserProfile.hostel,
+    UserProfile.interests,
+    User.id.label("user_id"),
+    User.username,
+    User.email,
+    User.is_verified,
+)
+IMAGE_COLUMNS = (
+    UserImage.user_id,
+    UserImage.id,
+    UserImage.image_url,
+    UserImage.thumbnail_url,
+    UserImage.medium_url,
+)
+
+
+def select_profiles():
+    """
+    SELECT of UserProfile ORM objects with their user and images loaded, for
+    detail endpoints. The user comes from the single join (no second join),
+    and images from one extra IN query, so rows are never multiplied by image
+    count and LIMIT applies to profiles directly.
+    """
+    return (
+        select(UserProfile)
+        .join(User, User.id == UserProfile.user_id)
+        .options(contains_eager(UserProfile.user).selectinload(User.images))
+    )
+
+
+def select_reports():
+    """
+    SELECT of ProfileReport with everything ProfileReportOut touches, loaded
+    in a fixed four extra IN queries however many reports are on the page.
+    """
+    return select(ProfileReport).options(
+        selectinload(ProfileReport.reporter),
+        selectinload(ProfileReport.reported_profile)
+        .selectinload(UserProfile.user)
+        .selectinload(User.images),
+    )
+
+
+def select_profile_rows():
+    """SELECT of PROFILE_COLUMNS over user_profiles joined to users; add filters/order/limit."""
+    return select(*PROFILE_COLUMNS).join(User, User.id == UserProfile.user_id)
+
+
+def select_image_rows(user_ids):
+    return select(*IMAGE_COLUMNS).where(UserImage.user_id.in_(user_ids))
+
+
+def build_profile_dicts(rows, image_rows):
+    """
+    Shape PROFILE_COLUMNS / IMAGE_COLUMNS tuples like UserProfileWithUser,
+    without going through ORM instances or Pydantic validation.
+    """
+    images_by_user = {}
+    for user_id, image_id, image_url, thumbnail_url, medium_url in image_rows:
+        images_by_user.setdefault(user_id, []).append({
+            "id": image_id,
+            "image_url": image_url,
+            "thumbnail_url": thumbnail_url,
+            "medium_url": medium_url,
+        })
+
+    return [
+        {
+            "id": profile_id,
+            "bio": bio,
+            "branch": branch,
+            "batch": batch,
+            "hostel": hostel,
+            "interests": interests,
+            "user": {
+                "id": user_id,
+                "username": username,
+                "email": email,
+                "is_verified": is_verified,
+                "images": images_by_user.get(user_id, []),
+            },
+        }
+        for profile_id, bio, branch, batch, hostel, interests, user_id, username, email, is_verified in rows
+    ]
+
+
+def dumps(data):
+    """orjson, falling back to FastAPI's encoder for Pydantic models and the like."""
+    return orjson.dumps(data, default=jsonable_encoder)
+
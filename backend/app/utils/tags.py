@@ -0,0 +1,214 @@
+import asyncio
+import bisect
+import heapq
+import os
+import threading
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import InterestTag, ProfileInterestTag, UserProfile
+
+TAG_INDEX_TTL = int(os.getenv("TAG_INDEX_TTL", 900))
+
+# Common spellings folded onto one tag; keys and values are normalized slugs
+TAG_ALIASES = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "cp": "competitive programming",
+    "dsa": "data structures and algorithms",
+    "webdev": "web development",
+    "web dev": "web development",
+    "appdev": "app development",
+    "app dev": "app development",
+}
+
+
+def normalize_tag(text):
+    """Slug for an interest as typed: trimmed, single-spaced, casefolded, de-aliased."""
+    if not isinstance(text, str):
+        return None
+    slug = " ".join(text.split()).casefold()
+    return TAG_ALIASES.get(slug, slug) or None
+
+
+def profile_tag_names(interests):
+    """{slug: display name} for a profile's interests, keeping the first spelling of each."""
+    names = {}
+    for interest in interests or []:
+        slug = normalize_tag(interest)
+        if slug and slug not in names:
+            names[slug] = " ".join(interest.split())
+    return names
+
+
+def sync_profile_tags(db: Session, profile):
+    """
+    Point the join table at the tags in `profile.interests`, creating tags
+    that don't exist yet. Runs inside the caller's transaction; the profile
+    must already be flushed.
+    :return: (slugs before, slugs after)
+    """
+    names = profile_tag_names(profile.interests)
+    before = dict(
+        db.query(InterestTag.slug, InterestTag.id)
+        .join(ProfileInterestTag, ProfileInterestTag.tag_id == InterestTag.id)
+        .filter(ProfileInterestTag.profile_id == profile.id)
+        .all()
+    )
+
+    removed = [tag_id for slug, tag_id in before.items() if slug not in names]
+    if removed:
+        db.query(ProfileInterestTag).filter(
+            ProfileInterestTag.profile_id == profile.id,
+            ProfileInterestTag.tag_id.in_(removed),
+        ).delete(synchronize_session=False)
+
+    added = {slug: name for slug, name in names.items() if slug not in before}
+    if added:
+        db.execute(
+            insert(InterestTag)
+            .values([{"slug": slug, "name": name} for slug, name in added.items()])
+            .on_conflict_do_nothing(index_elements=[InterestTag.slug])
+        )
+        tag_ids = db.query(InterestTag.id).filter(InterestTag.slug.in_(added))
+        db.execute(
+            insert(ProfileInterestTag)
+            .values([{"profile_id": profile.id, "tag_id": tag_id} for tag_id, in tag_ids])
+            .on_conflict_do_nothing()
+        )
+
+    return set(before), set(names)
+
+
+def link_new_profile_tags(db: Session, profiles):
+    """
+    Set-based sync_profile_tags for profiles that have no tag links yet,
+    e.g. rows just written by a bulk import. Runs inside the caller's
+    transaction; the profiles must already be flushed.
+    :param profiles: (profile id, interests) pairs
+    """
+    names, links = {}, []
+    for profile_id, interests in profiles:
+        for slug, name in profile_tag_names(interests).items():
+            names.setdefault(slug, name)
+            links.append((profile_id, slug))
+    if not links:
+        return
+
+    db.execute(
+        insert(InterestTag)
+        .values([{"slug": slug, "name": name} for slug, name in names.items()])
+        .on_conflict_do_nothing(index_elements=[InterestTag.slug])
+    )
+    tag_ids = dict(db.query(InterestTag.slug, InterestTag.id).filter(InterestTag.slug.in_(names)))
+    db.execute(
+        insert(ProfileInterestTag)
+        .values([{"profile_id": profile_id, "tag_id": tag_ids[slug]} for profile_id, slug in links])
+        .on_conflict_do_nothing()
+    )
+
+
+def backfill_profile_tags(db: Session):
+    """
+    Link every existing profile to its tags, e.g. once after the migration
+    that added them. Safe to re-run; normal writes go through sync_profile_tags.
+    """
+    profile_ids = [profile_id for profile_id, in db.query(UserProfile.id)]
+    for start in range(0, len(profile_ids), 500):
+        chunk = profile_ids[start:start + 500]
+        for profile in db.query(UserProfile).filter(UserProfile.id.in_(chunk)):
+            sync_profile_tags(db, profile)
+        db.commit()
+    return len(profile_ids)
+
+
+class TagIndex:
+    """
+    Slugs in sorted order with a profile count each, for prefix autocomplete
+    by bisection. Loaded from the join table and adjusted on every profile
+    write; per process, so other workers converge within the TTL.
+    """
+
+    def __init__(self, ttl: int = TAG_INDEX_TTL):
+        self.ttl = ttl
+        self._slugs = []
+        self._tags = {}  # slug -> [name, count]
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def is_stale(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def load(self, rows):
+        """Replace the index with (slug, name, count) rows."""
+        tags = {slug: [name, count] for slug, name, count in rows if count > 0}
+        with self._lock:
+            self._tags = tags
+            self._slugs = sorted(tags)
+            self._loaded_at = time.monotonic()
+
+    def apply(self, before, after, names=None):
+        """Move one profile from tag slugs `before` to `after`. A no-op until loaded."""
+        names = names or {}
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            for slug in set(before) - set(after):
+                entry = self._tags.get(slug)
+                if entry is None:
+                    continue
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self._tags[slug]
+                    del self._slugs[bisect.bisect_left(self._slugs, slug)]
+            for slug in set(after) - set(before):
+                entry = self._tags.get(slug)
+                if entry is None:
+                    self._tags[slug] = [names.get(slug, slug), 1]
+                    bisect.insort(self._slugs, slug)
+                else:
+                    entry[1] += 1
+
+    def complete(self, prefix: str, limit: int = 10):
+        """
+        Most used tags whose slug starts with `prefix`, or that an alias
+        starting with it stands for ("ML" suggests "machine learning"), as dicts.
+        """
+        prefix = " ".join(prefix.split()).casefold()
+        aliased = {slug for alias, slug in TAG_ALIASES.items() if alias.startswith(prefix) and not slug.startswith(prefix)}
+        with self._lock:
+            start = bisect.bisect_left(self._slugs, prefix)
+            end = bisect.bisect_left(self._slugs, prefix + "\U0010ffff")
+            candidates = self._slugs[start:end] + [slug for slug in aliased if slug in self._tags]
+            best = heapq.nsmallest(limit, candidates, key=lambda slug: (-self._tags[slug][1], slug))
+            return [{"slug": slug, "name": self._tags[slug][0], "count": self._tags[slug][1]} for slug in best]
+
+
+tag_index = TagIndex()
+_load_lock = asyncio.Lock()
+
+
+async def ensure_tag_index(db: AsyncSession):
+    """(Re)build the index from the join table when it is missing or past its TTL."""
+    if not tag_index.is_stale():
+        return
+    async with _load_lock:
+        if not tag_index.is_stale():
+            return
+        stmt = (
+            select(InterestTag.slug, InterestTag.name, func.count(ProfileInterestTag.profile_id))
+            .join(ProfileInterestTag, ProfileInterestTag.tag_id == InterestTag.id)
+            .group_by(InterestTag.id)
+        )
+        tag_index.load((await db.execute(stmt)).all())
+
+
+if __name__ == "__main__":
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        print(f"Linked tags for {backfill_profile_tags(db)} profiles")
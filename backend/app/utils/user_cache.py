@@ -0,0 +1,212 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.models import User
+
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 4096))
+USER_CACHE_URL = os.getenv("USER_CACHE_URL")  # e.g. redis://host:6379/0
+# Seconds to wait on Redis before falling back to the database
+USER_CACHE_TIMEOUT = float(os.getenv("USER_CACHE_TIMEOUT", 0.5))
+
+# The password hash never leaves the database; login reads it from there
+USER_COLUMNS = [column.key for column in User.__table__.columns if column.key != "hashed_password"]
+
+
+class MemoryUserCache:
+    """Per-process TTL + LRU cache. Also the stand-in for the shared backend in tests."""
+
+    def __init__(self, ttl: int = USER_CACHE_TTL, maxsize: int = USER_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    # Nothing here blocks, so the event loop can call straight through
+    async def aget(self, key: str):
+        return self.get(key)
+
+    async def aset(self, key: str, value: dict):
+        self.set(key, value)
+
+    async def adelete(self, key: str):
+        self.delete(key)
+
+
+class RedisUserCache:
+    """
+    Shared cache so invalidations reach every instance. Worker threads use the
+    blocking client and the event loop the asyncio one. Redis errors are
+    logged and treated as misses, so an outage falls back to the database.
+    """
+
+    def __init__(self, url: str, ttl: int = USER_CACHE_TTL, prefix: str = "user:", timeout: float = USER_CACHE_TIMEOUT):
+        import redis
+        import redis.asyncio
+
+        options = {"socket_timeout": timeout, "socket_connect_timeout": timeout}
+        self.client = redis.Redis.from_url(url, **options)
+        self.async_client = redis.asyncio.Redis.from_url(url, **options)
+        self.ttl = ttl
+        self.prefix = prefix
+        self._errors = (redis.RedisError, OSError)
+
+    def get(self, key: str):
+        try:
+            raw = self.client.get(self.prefix + key)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+            return None
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, value: dict):
+        try:
+            self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self.prefix + key)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+
+    async def aget(self, key: str):
+        try:
+            raw = await self.async_client.get(self.prefix + key)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def aset(self, key: str, value: dict):
+        try:
+            await self.async_client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+
+    async def adelete(self, key: str):
+        try:
+            await self.async_client.delete(self.prefix + key)
+        except self._errors as e:
+            print(f"[User Cache Error] {e!r}")
+
+
+_cache = RedisUserCache(USER_CACHE_URL) if USER_CACHE_URL else MemoryUserCache()
+# Evictions scheduled from the event loop, referenced until they finish
+_pending = set()
+
+
+def set_user_cache(cache):
+    """Swap the cache backend (e.g. a MemoryUserCache in tests)."""
+    global _cache
+    _cache = cache
+
+
+def _dump(user: User):
+    values = {}
+    for key in USER_COLUMNS:
+        value = getattr(user, key)
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values[key] = value
+    return values
+
+
+def _load(values: dict):
+    values = dict(values)
+    values["id"] = UUID(values["id"])
+    if values.get("last_verification_sent"):
+        values["last_verification_sent"] = datetime.fromisoformat(values["last_verification_sent"])
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+def get_cached_user(email: str):
+    """
+    Detached User rebuilt from the cache, or None on a miss. Callers attach it
+    to their session with `merge(user, load=False)`, which does not query.
+    `hashed_password` is not cached and loads from the database on access.
+    """
+    values = _cache.get(email)
+    return _load(values) if values else None
+
+
+async def get_cached_user_async(email: str):
+    """get_cached_user for the event loop, which must not wait on a blocking Redis call."""
+    values = await _cache.aget(email)
+    return _load(values) if values else None
+
+
+def cache_user(user: User):
+    _cache.set(user.email, _dump(user))
+
+
+async def cache_user_async(user: User):
+    await _cache.aset(user.email, _dump(user))
+
+
+def invalidate_user(email: str):
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # A worker thread (sync session), which may block
+        _cache.delete(email)
+        return
+    # AsyncSession flushes and commits run on the event loop; evict without blocking it
+    task = loop.create_task(_cache.adelete(email))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_write(mapper, connection, target):
+    # Covers is_verified, club_role and password changes from any ORM write.
+    # Evict now, and again once the write commits: until then other requests
+    # still read the old row and could put it back in the cache.
+    invalidate_user(target.email)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("stale_user_emails", set()).add(target.email)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for email in session.info.pop("stale_user_emails", ()):
+        invalidate_user(email)
@@ -0,0 +1,76 @@
+"""
+Cold-start cost of the backend: import time of app.main and wall time from
+launching uvicorn to the first 200 response.
+
+    python -m benchmarks.cold_start --path /openapi.json --runs 3
+
+Run from backend/ with the usual environment (.env). The import report lists
+the slowest modules from `python -X importtime`.
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def import_times(top):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=os.environ,
+    )
+    if proc.returncode != 0:
+        sys.exit(proc.stderr)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    total = max(cumulative for cumulative, _, name in rows if name.strip() == "app.main")
+    print(f"import app.main: {total / 1000:.1f}ms")
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f}ms cumulative {self_us / 1000:8.1f}ms self  {name}")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_200(path, timeout):
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.01)
+        raise TimeoutError(f"no 200 from {path} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", default="/openapi.json")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    import_times(args.top)
+    samples = [time_to_first_200(args.path, args.timeout) for _ in range(args.runs)]
+    print(f"time to first 200 on {args.path}: " + ", ".join(f"{s * 1000:.0f}ms" for s in samples))
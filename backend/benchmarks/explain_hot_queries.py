@@ -0,0 +1,65 @@
+"""
+Check that every hot endpoint query can be answered from an index.
+
+    python -m benchmarks.explain_hot_queries
+
+Run from backend/ against a migrated database. Sequential scans are disabled
+for the session, so any "Seq Scan" left in a plan means no usable index
+exists for that query. Exits non-zero if one is found.
+"""
+import json
+import sys
+import uuid
+
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.dialects import postgresql
+
+from app.database import SessionLocal
+from app.models import ProfileReport, User, UserProfile
+from app.routes.profiles import _search_filters
+from app.utils.serialization import select_image_rows, select_profile_rows
+
+SOME_ID = uuid.UUID(int=1)
+
+HOT_QUERIES = {
+    "login / current user": select(User).filter(User.email == "someone25@iitk.ac.in"),
+    "get-all-profiles (cursor)": select_profile_rows()
+        .filter(tuple_(User.username, User.id) > tuple_("m", SOME_ID))
+        .order_by(User.username, User.id)
+        .limit(10),
+    "profile images": select_image_rows([SOME_ID]),
+    "get-profile-by-id": select_profile_rows().filter(UserProfile.user_id == SOME_ID),
+    "get-club-members": select_profile_rows().filter(User.club_role == "coordinator"),
+    "search: username": select(User.id).filter(User.username.ilike("%fresh%")),
+    # The same tag join search-profiles builds
+    "search: interests": select(UserProfile.id).filter(_search_filters(None, None, None, ["ML"], None)["interests"]),
+    "reports for profile": select(ProfileReport).filter(ProfileReport.reported_profile_id == SOME_ID),
+}
+
+
+def seq_scans(plan):
+    """Yield relation names of every Seq Scan node in an EXPLAIN (FORMAT JSON) plan."""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan.get("Relation Name")
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+def main():
+    failures = 0
+    with SessionLocal() as db:
+        db.execute(text("SET enable_seqscan = off"))
+        for name, stmt in HOT_QUERIES.items():
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            scans = sorted(set(seq_scans(plan[0]["Plan"])))
+            status = "ok" if not scans else f"SEQ SCAN on {', '.join(scans)}"
+            failures += bool(scans)
+            print(f"{name:<28} {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Load test: drives the real FastAPI app in-process through scripted scenarios
+and reports throughput and p50/p95/p99 latency per endpoint.
+
+    python -m benchmarks.seed_population --users 5000
+    python -m benchmarks.load_test --save-baseline benchmarks/load_baseline.json
+    python -m benchmarks.load_test --baseline benchmarks/load_baseline.json
+
+Run from backend/ against the seeded database. S3 and SMTP are replaced by
+local stand-ins (optionally with simulated latency), so nothing leaves the
+machine. Each virtual user gets its own client IP, so the per-IP rate
+limits behave as they would with real traffic.
+
+Scenarios:
+    signup      signup -> verify from the captured mail -> login -> me ->
+                presign -> save profile with images
+    scroll      infinite scroll through get-all-profiles with cursors
+    detail      profile detail views, search and recommendations
+    moderation  coordinators paging through reports and reported profiles
+
+With --baseline, exits non-zero if any endpoint's p95 or p99 regressed by
+more than --tolerance.
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import re
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from urllib.parse import urlencode
+
+from sqlalchemy import select
+
+from app import auth
+from app.database import SessionLocal
+from app.main import app
+from app.models import User
+from app.utils.email import EmailDispatcher, set_dispatcher
+from app.utils.s3 import set_s3_client
+from benchmarks.seed_population import EMAIL_PATTERN
+
+# ---------------------------------------------------------------------------
+# Local stand-ins for S3 and SMTP
+
+
+def _placeholder_jpeg():
+    from PIL import Image
+
+    out = io.BytesIO()
+    Image.new("RGB", (1600, 1200), (90, 120, 200)).save(out, format="JPEG", quality=85)
+    return out.getvalue()
+
+
+class LocalS3:
+    """The handful of S3 client calls the app makes, against a dict."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.objects = {}
+        self._placeholder = None
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def generate_presigned_post(self, Bucket, Key, Fields=None, Conditions=None, ExpiresIn=3600):
+        return {"url": f"https://{Bucket}.s3.local/", "fields": {**(Fields or {}), "key": Key, "policy": "local"}}
+
+    def get_object(self, Bucket, Key):
+        self._wait()
+        if Key not in self.objects:
+            if self._placeholder is None:
+                self._placeholder = _placeholder_jpeg()
+            return {"Body": io.BytesIO(self._placeholder)}
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._wait()
+        self.objects[Key] = Body
+
+    def delete_object(self, Bucket, Key):
+        self._wait()
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        self._wait()
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+        return {}
+
+
+class LocalMailbox(EmailDispatcher):
+    """Dispatcher that 'delivers' into memory, so scenarios can read the verification link."""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self._tokens = {}
+        self._waiters = defaultdict(asyncio.Event)
+
+    async def _send(self, message):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body = message.get_body(("plain",)).get_content()
+        to_email = message["To"].lower()
+        self._tokens[to_email] = re.search(r"token=([\w\-.]+)", body).group(1)
+        self._waiters[to_email].set()
+
+    async def _disconnect(self):
+        pass
+
+    async def token_for(self, email: str, timeout: float = 30):
+        await asyncio.wait_for(self._waiters[email.lower()].wait(), timeout)
+        return self._tokens[email.lower()]
+
+
+# ---------------------------------------------------------------------------
+# In-process ASGI client
+
+
+class Client:
+    """One virtual user: an IP address and a cookie jar talking straight to the ASGI app."""
+
+    def __init__(self, recorder, ip: str):
+        self.recorder = recorder
+        self.ip = ip
+        self.cookies = {}
+
+    async def request(self, name: str, method: str, path: str, params=None, json_body=None):
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        headers = [(b"host", b"loadtest"), (b"x-forwarded-for", self.ip.encode())]
+        if json_body is not None:
+            headers.append((b"content-type", b"application/json"))
+        if self.cookies:
+            cookie = "; ".join(f"{key}={value}" for key, value in self.cookies.items())
+            headers.append((b"cookie", cookie.encode()))
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+            "query_string": urlencode(params or {}, doseq=True).encode(), "root_path": "",
+            "headers": headers, "client": (self.ip, 50000), "server": ("loadtest", 80),
+        }
+        requested = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal requested
+            if requested:
+                await finished.wait()
+                return {"type": "http.disconnect"}
+            requested = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        response = {"status": None, "headers": [], "body": b""}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                response["body"] += message.get("body", b"")
+                if not message.get("more_body", False):
+                    # What a browser would wait for; background tasks run after this
+                    response["elapsed"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            await app(scope, receive, send)
+        finally:
+            finished.set()
+        self.recorder.record(name, response.get("elapsed", time.perf_counter() - start), response["status"])
+
+        for key, value in response["headers"]:
+            if key.lower() == b"set-cookie":
+                cookie_name, _, rest = value.decode().partition("=")
+                self.cookies[cookie_name] = rest.split(";", 1)[0]
+        return response["status"], response["body"]
+
+    async def json(self, *args, **kwargs):
+        status, body = await self.request(*args, **kwargs)
+        return status, (json.loads(body) if body and status is not None and status < 500 else None)
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)  # name -> seconds
+        self.errors = defaultdict(int)
+        self.wall = defaultdict(float)  # name -> wall time of the scenarios it ran in
+
+    def record(self, name: str, seconds: float, status):
+        self.samples[name].append(seconds)
+        if status is None or status >= 400:
+            self.errors[name] += 1
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+
+
+def _ip(n: int):
+    return f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"
+
+
+async def signup_flow(client, mailbox, email, password, run_id):
+    status, _ = await client.json("POST /auth/signup", "POST", "/auth/signup", json_body={
+        "username": f"Burst {run_id} {email[:10]}", "email": email, "password": password,
+    })
+    if status != 200:
+        return
+    token = await mailbox.token_for(email)
+    await client.json("GET /auth/verify-email", "GET", "/auth/verify-email", params={"token": token})
+    status, _ = await client.json("POST /auth/login", "POST", "/auth/login", json_body={"email": email, "password": password})
+    if status != 200:
+        return
+    await client.json("GET /auth/me", "GET", "/auth/me")
+    status, presigned = await client.json(
+        "POST /s3/presign-batch", "POST", "/s3/presign-batch", json_body={"filenames": ["1.jpg", "2.jpg"]},
+    )
+    keys = [upload["key"] for upload in presigned["uploads"]] if status == 200 else []
+    await client.json("POST /profile/create-or-update-profile", "POST", "/profile/create-or-update-profile", json_body={
+        "bio": "Signed up during the load test.", "branch": "CSE", "hostel": "Hall 5",
+        "interests": ["Music", "ML", "Chess"], "image_keys": keys,
+    })
+
+
+async def scroll_flow(client, pages, limit):
+    cursor = ""
+    for _ in range(pages):
+        status, page = await client.json(
+            "POST /profile/get-all-profiles", "POST", "/profile/get-all-profiles",
+            params={"cursor": cursor, "limit": limit},
+        )
+        if status != 200 or not page["next_cursor"]:
+            return
+        cursor = page["next_cursor"]
+
+
+async def detail_flow(client, rng, user_ids, views):
+    for _ in range(views):
+        await client.json("GET /profile/get-profile-by-id", "GET", "/profile/get-profile-by-id", params={"id": rng.choice(user_ids)})
+    await client.json("GET /profile/search-profiles", "GET", "/profile/search-profiles", params={"q": "fresher", "limit": 20})
+    await client.json("GET /profile/recommendations", "GET", "/profile/recommendations")
+
+
+async def moderation_flow(client, pages):
+    for path in ("/profile/reports", "/profile/reported-profiles"):
+        cursor = ""
+        for _ in range(pages):
+            status, page = await client.json(f"GET {path}", "GET", path, params={"cursor": cursor, "limit": 20})
+            if status != 200 or not page["next_cursor"]:
+                break
+            cursor = page["next_cursor"]
+
+
+async def run_scenario(name, recorder, flows, concurrency):
+    """Run every flow with at most `concurrency` in flight; returns wall seconds."""
+    slots = asyncio.Semaphore(concurrency)
+    before = {endpoint: len(samples) for endpoint, samples in recorder.samples.items()}
+
+    async def guarded(flow):
+        async with slots:
+            try:
+                await flow
+            except Exception as e:
+                # Starlette has already answered 500 and the request was recorded
+                print(f"[{name}] virtual user stopped: {e!r}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(guarded(flow) for flow in flows))
+    wall = time.perf_counter() - start
+    for endpoint, samples in recorder.samples.items():
+        if len(samples) > before.get(endpoint, 0):
+            recorder.wall[endpoint] += wall
+    print(f"{name:<11} {len(flows):>5} virtual users in {wall:.1f}s")
+
+
+def seeded_users():
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(User.id, User.email, User.club_role).where(User.email.like(EMAIL_PATTERN))
+        ).all()
+    if not rows:
+        raise SystemExit("No seeded population; run `python -m benchmarks.seed_population` first")
+    return rows
+
+
+def signed_in(recorder, ip_number, email):
+    client = Client(recorder, _ip(ip_number))
+    client.cookies["access_token"] = auth.create_access_token({"sub": email})
+    return client
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    mailbox = LocalMailbox(args.smtp_latency)
+    set_dispatcher(mailbox)
+    set_s3_client(LocalS3(args.s3_latency))
+
+    users = seeded_users()
+    user_ids = [str(user_id) for user_id, _, _ in users]
+    moderators = [email for _, email, role in users if role in ("secretary", "coordinator")]
+    run_id = uuid.uuid4().hex[:6]
+
+    async with app.router.lifespan_context(app):
+        scenarios = {
+            "signup": lambda: [
+                signup_flow(Client(recorder, _ip(i)), mailbox, f"ltb{run_id}{i:05d}25@iitk.ac.in", "burst-password", run_id)
+                for i in range(args.signups)
+            ],
+            "scroll": lambda: [
+                scroll_flow(Client(recorder, _ip(100000 + i)), args.pages, args.page_size)
+                for i in range(args.scrollers)
+            ],
+            "detail": lambda: [
+                detail_flow(signed_in(recorder, 200000 + i, rng.choice(users)[1]), rng, user_ids, args.views)
+                for i in range(args.viewers)
+            ],
+            "moderation": lambda: [
+                moderation_flow(signed_in(recorder, 300000 + i, moderators[i % len(moderators)]), args.pages)
+                for i in range(args.moderators if moderators else 0)
+            ],
+        }
+        for name in args.scenarios:
+            await run_scenario(name, recorder, scenarios[name](), args.concurrency)
+
+    return report(recorder)
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def report(recorder):
+    results = {}
+    print(f"\n{'endpoint':<40} {'n':>6} {'err':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for name in sorted(recorder.samples):
+        samples = recorder.samples[name]
+        results[name] = {
+            "n": len(samples),
+            "errors": recorder.errors[name],
+            "rps": round(len(samples) / recorder.wall[name], 1) if recorder.wall[name] else 0,
+            "p50": round(statistics.median(samples) * 1000, 2),
+            "p95": round(percentile(samples, 95) * 1000, 2),
+            "p99": round(percentile(samples, 99) * 1000, 2),
+        }
+        r = results[name]
+        print(f"{name:<40} {r['n']:>6} {r['errors']:>5} {r['rps']:>8} {r['p50']:>8} {r['p95']:>8} {r['p99']:>8}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print endpoints whose p95/p99 grew past the baseline; returns whether any did."""
+    regressed = False
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for stat in ("p95", "p99"):
+            if current[stat] > previous[stat] * (1 + tolerance):
+                regressed = True
+                print(f"REGRESSION {name} {stat}: {previous[stat]}ms -> {current[stat]}ms")
+    if not regressed:
+        print(f"\nNo endpoint regressed by more than {tolerance:.0%} against the baseline")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", default=["signup", "scroll", "detail", "moderation"],
+                        choices=["signup", "scroll", "detail", "moderation"])
+    parser.add_argument("--concurrency", type=int, default=50, help="virtual users in flight per scenario")
+    parser.add_argument("--signups", type=int, default=200)
+    parser.add_argument("--scrollers", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--viewers", type=int, default=200)
+    parser.add_argument("--views", type=int, default=10, help="profile views per viewer")
+    parser.add_argument("--moderators", type=int, default=5, help="concurrent moderator sessions")
+    parser.add_argument("--s3-latency", type=float, default=0.02, help="simulated seconds per S3 call")
+    parser.add_argument("--smtp-latency", type=float, default=0.2, help="simulated seconds per mail")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95/p99 growth over the baseline")
+    parser.add_argument("--save-baseline", help="write this run's results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as f:
+            if compare(results, json.load(f), args.tolerance):
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
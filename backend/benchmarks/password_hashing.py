@@ -0,0 +1,90 @@
+"""
+Login/signup latency under concurrent load, with bcrypt run inline on the
+event loop (the old behaviour) versus on the bounded hashing pool.
+
+    python -m benchmarks.password_hashing --requests 200 --concurrency 50
+
+Run from backend/. Only the hashing path is exercised; no database or SMTP
+connection is opened.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "postgresql://bench@localhost/bench")
+
+from fastapi import HTTPException  # noqa: E402
+
+from app import auth  # noqa: E402
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def login_inline(hashed):
+    auth.verify_password("correct horse", hashed)
+
+
+async def login_pooled(hashed):
+    await auth.verify_password_async("correct horse", hashed)
+
+
+async def signup_inline(_):
+    auth.get_password_hash("correct horse")
+
+
+async def signup_pooled(_):
+    await auth.get_password_hash_async("correct horse")
+
+
+async def drive(handler, hashed, requests, concurrency):
+    gate = asyncio.Semaphore(concurrency)
+    latencies, rejected = [], 0
+
+    async def one():
+        nonlocal rejected
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await handler(hashed)
+            except HTTPException:
+                rejected += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, rejected, time.perf_counter() - start
+
+
+def report(name, latencies, rejected, elapsed):
+    print(
+        f"{name:<16} n={len(latencies):<5} rejected={rejected:<4} "
+        f"rps={len(latencies) / elapsed:8.1f} "
+        f"p50={statistics.median(latencies) * 1000:8.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:8.1f}ms"
+    )
+
+
+async def main(requests, concurrency):
+    hashed = auth.get_password_hash("correct horse")
+    print(f"workers={auth.PASSWORD_HASH_WORKERS} queue={auth.PASSWORD_HASH_QUEUE} concurrency={concurrency}")
+    for name, handler in [
+        ("login inline", login_inline),
+        ("login pooled", login_pooled),
+        ("signup inline", signup_inline),
+        ("signup pooled", signup_pooled),
+    ]:
+        report(name, *await drive(handler, hashed, requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,93 @@
+"""
+Serialization cost of a profile list response: the previous path (ORM objects
+validated through UserProfileWithUser and encoded with jsonable_encoder + json)
+versus column tuples shaped into dicts and encoded with orjson.
+
+    python -m benchmarks.profile_serialization --repeat 200
+
+Run from backend/. Rows are synthetic; no database connection is opened.
+"""
+import argparse
+import json
+import os
+import time
+import uuid
+from collections import namedtuple
+
+os.environ.setdefault("DATABASE_URL", "postgresql://bench@localhost/bench")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.models import User, UserImage, UserProfile  # noqa: E402
+from app.schemas import UserProfileWithUser  # noqa: E402
+from app.utils.serialization import build_profile_dicts, dumps  # noqa: E402
+
+IMAGES_PER_PROFILE = 3
+
+ProfileRow = namedtuple(
+    "ProfileRow",
+    "id bio branch batch hostel interests user_id username email is_verified",
+)
+ImageRow = namedtuple("ImageRow", "user_id id image_url thumbnail_url medium_url")
+
+
+def synthetic(n):
+    orm, rows, image_rows = [], [], []
+    for i in range(n):
+        user_id = uuid.uuid4()
+        user = User(id=user_id, username=f"fresher{i}", email=f"fresher{i}25@iitk.ac.in", is_verified=True)
+        for j in range(IMAGES_PER_PROFILE):
+            url = f"https://bucket.s3.region.amazonaws.com/user-profiles/{user_id}/{j}.jpg"
+            image = UserImage(id=uuid.uuid4(), user_id=user_id, image_key=url, image_url=url)
+            user.images.append(image)
+            image_rows.append(ImageRow(user_id, image.id, url, None, None))
+        profile = UserProfile(
+            id=uuid.uuid4(), user_id=user_id, bio="Hello " * 20, branch="CSE",
+            batch="Y25", hostel="hall 12", interests=["ML", "music", "chess"],
+        )
+        profile.user = user
+        orm.append(profile)
+        rows.append(ProfileRow(
+            profile.id, profile.bio, profile.branch, profile.batch, profile.hostel,
+            profile.interests, user_id, user.username, user.email, user.is_verified,
+        ))
+    return orm, rows, image_rows
+
+
+def from_orm(profile):
+    # from_orm needs orm_mode, which Pydantic 2 no longer reads
+    if hasattr(UserProfileWithUser, "model_validate"):
+        return UserProfileWithUser.model_validate(profile, from_attributes=True)
+    return UserProfileWithUser.from_orm(profile)
+
+
+def previous_path(orm, rows, image_rows):
+    validated = [from_orm(p) for p in orm]
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def fast_path(orm, rows, image_rows):
+    return dumps(build_profile_dicts(rows, image_rows))
+
+
+def timeit(fn, args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat):
+    print(f"{'profiles':>8} {'previous':>12} {'fast':>12} {'speedup':>8}")
+    for n in (10, 100, 1000):
+        args = synthetic(n)
+        assert json.loads(previous_path(*args)) == json.loads(fast_path(*args))
+        before = timeit(previous_path, args, repeat)
+        after = timeit(fast_path, args, repeat)
+        print(f"{n:>8} {before * 1000:>10.3f}ms {after * 1000:>10.3f}ms {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args().repeat)
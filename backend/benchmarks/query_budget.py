@@ -0,0 +1,143 @@
+"""
+Query budget check: calls the hot endpoints in-process and counts the SQL
+statements each one runs and the rows Postgres returns for them.
+
+    python -m benchmarks.seed_population --users 5000
+    python -m benchmarks.query_budget
+
+Run from backend/ against the seeded database. List endpoints are called at
+two page sizes: the statement count must not change with the page size (no
+N+1 loading), and rows must stay within one row per item plus one per image,
+so joins never multiply rows by image count. Response and user caches are
+emptied before every call, so each one pays its full uncached cost. Exits
+non-zero if any endpoint goes over its budget.
+"""
+import argparse
+import asyncio
+import sys
+from collections import namedtuple
+from contextvars import ContextVar
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+
+from app.database import SessionLocal
+from app.models import User, UserImage, UserProfile
+from app.utils.response_cache import response_cache
+from app.utils.user_cache import MemoryUserCache, set_user_cache
+from benchmarks.load_test import Client, Recorder, seeded_users, signed_in
+
+# statements: most statements per call, whatever the page size
+# rows: rows per item besides images; images: image sets per item
+# paged: whether the endpoint takes `limit`; otherwise it returns one item,
+# or every club member for get-club-members
+Budget = namedtuple("Budget", "method path params signed_in statements rows images paged")
+
+BUDGETS = {
+    "get-all-profiles": Budget("POST", "/profile/get-all-profiles", {"cursor": ""}, None, 2, 1, 1, True),
+    "search-profiles": Budget("GET", "/profile/search-profiles", {"q": "fresher"}, None, 2, 1, 1, True),
+    "get-profile-by-id": Budget("GET", "/profile/get-profile-by-id", {}, None, 2, 1, 1, False),
+    "get-my-profile": Budget("GET", "/profile/get-my-profile", {}, "user", 3, 2, 1, False),
+    "get-club-members": Budget("GET", "/profile/get-club-members", {}, None, 2, 1, 1, False),
+    # report, reporter and the reported profile's user, plus the moderator lookup
+    "reports": Budget("GET", "/profile/reports", {"cursor": ""}, "moderator", 6, 4, 1, True),
+    "reported-profiles": Budget("GET", "/profile/reported-profiles", {"cursor": ""}, "moderator", 4, 2, 1, True),
+}
+# Rows any call may add regardless of page size, e.g. the current user
+FIXED_ROWS = 2
+
+_counts = ContextVar("query_budget_counts", default=None)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count(conn, cursor, statement, parameters, context, executemany):
+    counts = _counts.get()
+    if counts is not None:
+        counts[0] += 1
+        counts[1] += max(cursor.rowcount, 0)
+
+
+def max_images_per_user():
+    with SessionLocal() as db:
+        per_user = select(func.count().label("n")).select_from(UserImage).group_by(UserImage.user_id).subquery()
+        return db.scalar(select(func.max(per_user.c.n))) or 0
+
+
+def club_member_count():
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.count()).select_from(UserProfile).join(User, User.id == UserProfile.user_id)
+            .where(User.club_role.isnot(None))
+        )
+
+
+async def measure(client, budget, params):
+    """(statements, rows) of one uncached call, or None if it did not succeed."""
+    response_cache.clear()
+    set_user_cache(MemoryUserCache())
+    counts = [0, 0]
+    token = _counts.set(counts)
+    try:
+        status, _ = await client.request("budget", budget.method, budget.path, params=params)
+    finally:
+        _counts.reset(token)
+    return tuple(counts) if status == 200 else None
+
+
+async def run(page_sizes):
+    users = seeded_users()
+    user, moderator = users[-1], next((u for u in users if u.club_role), None)
+    images = max_images_per_user()
+    unpaged_items = {"get-club-members": club_member_count()}
+    recorder = Recorder()
+    clients = {
+        None: Client(recorder, "10.0.0.1"),
+        "user": signed_in(recorder, 2, user.email),
+        "moderator": signed_in(recorder, 3, moderator.email) if moderator else None,
+    }
+
+    failures = 0
+    print(f"{'endpoint':<20} {'limit':>5} {'statements':>12} {'rows':>12}")
+    for name, budget in BUDGETS.items():
+        client = clients[budget.signed_in]
+        if client is None:
+            print(f"{name:<20} skipped: no seeded coordinator")
+            continue
+        params = dict(budget.params)
+        if name == "get-profile-by-id":
+            params["id"] = str(user.id)
+
+        statement_counts = set()
+        for limit in page_sizes if budget.paged else [unpaged_items.get(name, 1)]:
+            if budget.paged:
+                params["limit"] = limit
+            measured = await measure(client, budget, params)
+            if measured is None:
+                print(f"{name:<20} {limit:>5} request failed")
+                failures += 1
+                continue
+            statements, rows = measured
+            statement_counts.add(statements)
+            row_budget = limit * (budget.rows + budget.images * images) + FIXED_ROWS
+            over = statements > budget.statements or rows > row_budget
+            failures += over
+            print(
+                f"{name:<20} {limit:>5} {statements:>5} / {budget.statements:<4} {rows:>5} / {row_budget:<4}"
+                f"{'  OVER BUDGET' if over else ''}"
+            )
+        if len(statement_counts) > 1:
+            failures += 1
+            print(f"{name:<20} statement count grows with the page size: {sorted(statement_counts)}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[5, 20])
+    failures = asyncio.run(run(parser.parse_args().page_sizes))
+    print(f"\n{failures} endpoint(s) over budget" if failures else "\nAll endpoints within budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
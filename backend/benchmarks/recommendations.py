@@ -0,0 +1,110 @@
+"""
+Recommendation latency on a synthetic directory: the inverted interest index
+(only users sharing a tag are scored) versus scoring every profile.
+
+    python -m benchmarks.recommendations --profiles 50000 --queries 200
+
+Run from backend/. Profiles are synthetic; no database connection is opened.
+"""
+import argparse
+import heapq
+import os
+import random
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "postgresql://bench@localhost/bench")
+
+from app.utils.recommendations import (  # noqa: E402
+    SAME_BRANCH_BONUS,
+    SAME_HOSTEL_BONUS,
+    InterestIndex,
+    normalize_interests,
+)
+
+VOCABULARY = 400
+BRANCHES = ["CSE", "EE", "ME", "CE", "CHE", "AE", "MSE", "BSBE", "PHY", "CHM", "MTH", "ECO", "ES"]
+HOSTELS = [f"hall {i}" for i in range(1, 15)]
+
+
+def synthetic(n, seed):
+    rng = random.Random(seed)
+    # Zipf-ish popularity: a few interests are very common, most are niche
+    tags = [f"interest {i}" for i in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]
+    rows = []
+    for _ in range(n):
+        interests = set(rng.choices(tags, weights, k=rng.randint(2, 8)))
+        rows.append((uuid.uuid4(), sorted(interests), rng.choice(BRANCHES), rng.choice(HOSTELS)))
+    return rows
+
+
+def full_scan(index, user_id, interests, branch, hostel, limit):
+    """The same scoring with every profile as a candidate, i.e. without the inverted index."""
+    tags = normalize_interests(interests)
+    total = len(index._profiles)
+    start = time.perf_counter()
+    scored = []
+    for other, (other_tags, other_branch, other_hostel) in index._profiles.items():
+        if other == user_id:
+            continue
+        shared = sum(index._idf(tag, total) for tag in tags & other_tags)
+        union = sum(index._idf(tag, total) for tag in tags | other_tags)
+        score = shared / union if union else 0.0
+        score += SAME_HOSTEL_BONUS if hostel and other_hostel == hostel else 0
+        score += SAME_BRANCH_BONUS if branch and other_branch == branch else 0
+        scored.append((score, other))
+    best = heapq.nlargest(limit, scored, key=lambda item: item[0])
+    return time.perf_counter() - start, {other for _, other in best}
+
+
+def percentile(samples, pct):
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def main(profiles, queries, limit, seed):
+    rows = synthetic(profiles, seed)
+    index = InterestIndex()
+
+    start = time.perf_counter()
+    index.load(rows)
+    print(f"build      {profiles} profiles in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    rng = random.Random(seed + 1)
+    samples = []
+    for user_id, interests, branch, hostel in rng.sample(rows, queries):
+        start = time.perf_counter()
+        index.recommend(user_id, interests, branch, hostel, limit)
+        samples.append(time.perf_counter() - start)
+    print(
+        f"recommend  p50 {percentile(samples, 50) * 1000:.2f}ms"
+        f"  p95 {percentile(samples, 95) * 1000:.2f}ms"
+        f"  mean {statistics.mean(samples) * 1000:.2f}ms"
+    )
+
+    samples = []
+    for user_id, interests, branch, hostel in rng.sample(rows, queries):
+        start = time.perf_counter()
+        index.update(user_id, rng.sample(interests, max(1, len(interests) - 1)), branch, hostel)
+        samples.append(time.perf_counter() - start)
+    print(f"update     mean {statistics.mean(samples) * 1_000_000:.1f}us")
+
+    scans, recall = [], []
+    for user_id, interests, branch, hostel in rows[:min(queries, 20)]:
+        elapsed, exact = full_scan(index, user_id, interests, branch, hostel, limit)
+        found = {other for other, _, _ in index.recommend(user_id, interests, branch, hostel, limit)}
+        scans.append(elapsed)
+        recall.append(len(found & exact) / max(len(exact), 1))
+    print(f"full scan  mean {statistics.mean(scans) * 1000:.2f}ms (scores all {profiles} profiles)")
+    print(f"recall     {statistics.mean(recall):.1%} of the exact top {limit}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    main(args.profiles, args.queries, args.limit, args.seed)
@@ -0,0 +1,141 @@
+"""
+Seed Postgres with a synthetic population for the load test: verified users
+with profiles, images and reports, plus a few coordinators.
+
+    python -m benchmarks.seed_population --users 5000
+    python -m benchmarks.seed_population --users 50000 --reset
+
+Run from backend/ against a scratch database that is at `alembic upgrade
+head`. Seeded users have emails lt<number>@loadtest.invalid, a domain no
+real account can have, and the password LOADTEST_PASSWORD; --reset removes
+only them (and anything they reported or were reported for) first. They
+sign in by token in the load test, so the app never checks their address.
+"""
+import argparse
+import random
+import time
+import uuid
+
+from sqlalchemy import delete, insert, or_, select
+
+from app.auth import get_password_hash
+from app.database import SessionLocal
+from app.models import ProfileReport, User, UserImage, UserProfile
+from app.utils.facets import rebuild_facet_counts
+from app.utils.images import IMAGE_VARIANTS, variant_key
+from app.utils.s3 import s3_public_url
+from app.utils.tags import backfill_profile_tags
+
+LOADTEST_PASSWORD = "loadtest-password"
+# Reserved (RFC 2606), so the pattern below cannot match a real account
+SEED_DOMAIN = "loadtest.invalid"
+EMAIL_PATTERN = f"%@{SEED_DOMAIN}"
+BATCH = 1000
+
+BRANCHES = ["CSE", "EE", "ME", "CE", "CHE", "AE", "MSE", "BSBE", "PHY", "CHM", "MTH", "ECO", "ES"]
+HOSTELS = [f"Hall {i}" for i in range(1, 14)] + ["GH1", "GH2"]
+INTERESTS = [
+    "Music", "Chess", "ML", "Machine Learning", "Competitive Programming", "Football", "Cricket",
+    "Photography", "Dance", "Web Development", "Robotics", "Astronomy", "Quizzing", "Debating",
+    "Painting", "Guitar", "Badminton", "Basketball", "Finance", "Poetry", "Gaming", "Cooking",
+    "Anime", "Movies", "Trekking", "Cycling", "Swimming", "Drama", "Blockchain", "Economics",
+] + [f"Niche Interest {i}" for i in range(200)]
+
+
+def seed_email(i):
+    return f"lt{i:06d}@{SEED_DOMAIN}"
+
+
+def reset(db):
+    user_ids = select(User.id).where(User.email.like(EMAIL_PATTERN))
+    db.execute(delete(ProfileReport).where(or_(
+        ProfileReport.reporter_id.in_(user_ids),
+        ProfileReport.reported_profile_id.in_(user_ids),
+    )))
+    db.execute(delete(UserImage).where(UserImage.user_id.in_(user_ids)))
+    db.execute(delete(UserProfile).where(UserProfile.user_id.in_(user_ids)))
+    db.execute(delete(User).where(User.email.like(EMAIL_PATTERN)))
+    db.commit()
+
+
+def insert_batches(db, model, rows):
+    for i in range(0, len(rows), BATCH):
+        db.execute(insert(model), rows[i:i + BATCH])
+
+
+def seed(db, users, images_per_user, report_rate, moderators, rng):
+    hashed = get_password_hash(LOADTEST_PASSWORD)  # one bcrypt hash shared by everyone
+    weights = [1 / (rank + 1) for rank in range(len(INTERESTS))]
+
+    user_rows, profile_rows, image_rows = [], [], []
+    for i in range(users):
+        user_id = uuid.uuid4()
+        user_rows.append({
+            "id": user_id,
+            "username": f"Load Test {i:06d}",
+            "email": seed_email(i),
+            "hashed_password": hashed,
+            "is_verified": True,
+            "club_role": "coordinator" if i < moderators else None,
+        })
+        profile_rows.append({
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "bio": f"Synthetic fresher number {i}. " * rng.randint(1, 8),
+            "branch": rng.choice(BRANCHES),
+            "batch": "Y25",
+            "hostel": rng.choice(HOSTELS),
+            "interests": sorted(set(rng.choices(INTERESTS, weights, k=rng.randint(1, 5)))),
+        })
+        for j in range(images_per_user):
+            key = f"user-profiles/{user_id}/{j}.jpg"
+            row = {"id": uuid.uuid4(), "user_id": user_id, "image_key": key, "image_url": s3_public_url(key)}
+            for name in IMAGE_VARIANTS:
+                row[f"{name}_key"] = variant_key(key, name)
+                row[f"{name}_url"] = s3_public_url(variant_key(key, name))
+            image_rows.append(row)
+
+    pairs = set()
+    while len(pairs) < int(users * report_rate) and users > 1:
+        reporter, reported = rng.sample(range(users), 2)
+        pairs.add((reporter, reported))
+    report_rows = [
+        {
+            "id": uuid.uuid4(),
+            "reporter_id": user_rows[reporter]["id"],
+            "reported_profile_id": user_rows[reported]["id"],
+            "reason": rng.choice([None, "Spam", "Offensive bio", "Fake profile"]),
+        }
+        for reporter, reported in pairs
+    ]
+
+    for model, rows in ((User, user_rows), (UserProfile, profile_rows), (UserImage, image_rows), (ProfileReport, report_rows)):
+        start = time.perf_counter()
+        insert_batches(db, model, rows)
+        db.commit()
+        print(f"{model.__tablename__:<16} {len(rows):>8} rows in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    rebuild_facet_counts(db)
+    backfill_profile_tags(db)
+    print(f"{'facets and tags':<16} {'':>8}      in {time.perf_counter() - start:.1f}s")
+
+
+def main(args):
+    with SessionLocal() as db:
+        if args.reset:
+            reset(db)
+        elif db.scalar(select(User.id).where(User.email.like(EMAIL_PATTERN)).limit(1)):
+            raise SystemExit("Database already has a seeded population; pass --reset to replace it")
+        seed(db, args.users, args.images, args.report_rate, args.moderators, random.Random(args.seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--images", type=int, default=3, help="images per user")
+    parser.add_argument("--report-rate", type=float, default=0.02, help="reports per user")
+    parser.add_argument("--moderators", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reset", action="store_true")
+    main(parser.parse_args())
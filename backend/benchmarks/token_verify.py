@@ -0,0 +1,87 @@
+"""
+Access-token verification throughput on one core: PyJWT per algorithm,
+python-jose HS256 (the previous backend) when it is installed, and a hit in
+the verified-token cache that auth.get_token_subject goes through.
+
+    python -m benchmarks.token_verify --seconds 2
+
+Run from backend/. Keys are generated on the fly; no database connection is
+opened.
+"""
+import argparse
+import os
+import time
+from datetime import timedelta
+
+os.environ.setdefault("DATABASE_URL", "postgresql://bench@localhost/bench")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-with-enough-entropy")
+
+import jwt  # noqa: E402
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519  # noqa: E402
+
+from app import auth  # noqa: E402
+
+
+def private_pem(key):
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+KEYS = {
+    "HS256": None,
+    "ES256": lambda: private_pem(ec.generate_private_key(ec.SECP256R1())),
+    "EdDSA": lambda: private_pem(ed25519.Ed25519PrivateKey.generate()),
+}
+
+
+def use_algorithm(algorithm):
+    """Point app.auth at `algorithm` with a fresh key, as if set in the environment."""
+    auth.ALGORITHM = algorithm
+    make_key = KEYS[algorithm]
+    if make_key:
+        os.environ["JWT_PRIVATE_KEY"] = make_key()
+    else:
+        os.environ.pop("JWT_PRIVATE_KEY", None)
+    auth.get_jwt_keys.cache_clear()
+    return auth.get_jwt_keys()
+
+
+def rate(fn, seconds):
+    calls, deadline = 0, time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        calls += 100
+    return calls / seconds
+
+
+def main(seconds):
+    print(f"{'backend':<26} {'verifies/s':>12}")
+    for algorithm in KEYS:
+        _, verify_key = use_algorithm(algorithm)
+        token = auth.create_access_token({"sub": "fresher25@iitk.ac.in"}, timedelta(hours=1))
+        uncached = rate(lambda: jwt.decode(token, verify_key, algorithms=[algorithm]), seconds)
+        print(f"{'pyjwt ' + algorithm:<26} {uncached:>12,.0f}")
+
+        auth.decode_token(token)
+        cached = rate(lambda: auth.decode_token(token), seconds)
+        print(f"{'token cache ' + algorithm:<26} {cached:>12,.0f}")
+
+    try:
+        from jose import jwt as jose_jwt
+    except ImportError:
+        print(f"{'python-jose HS256':<26} {'(not installed)':>12}")
+        return
+    token = jose_jwt.encode({"sub": "fresher25@iitk.ac.in", "exp": int(time.time()) + 3600}, auth.SECRET_KEY)
+    jose_rate = rate(lambda: jose_jwt.decode(token, auth.SECRET_KEY, algorithms=["HS256"]), seconds)
+    print(f"{'python-jose HS256':<26} {jose_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    main(parser.parse_args().seconds)
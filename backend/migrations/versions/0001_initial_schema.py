@@ -0,0 +1,71 @@
+"""Initial schema, as previously created by metadata.create_all()
+
+Databases that were created by the app before migrations existed already
+have these tables: mark them with `alembic stamp 0001` instead of upgrading.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("username", sa.String()),
+        sa.Column("email", sa.String()),
+        sa.Column("hashed_password", sa.String()),
+        sa.Column("is_verified", sa.Boolean()),
+        sa.Column("last_verification_sent", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("club_role", sa.String(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "user_profiles",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False, unique=True),
+        sa.Column("bio", sa.String(), nullable=True),
+        sa.Column("branch", sa.String(), nullable=True),
+        sa.Column("batch", sa.String(), nullable=True),
+        sa.Column("hostel", sa.String(), nullable=True),
+        sa.Column("interests", sa.JSON(), nullable=True),
+    )
+    op.create_index("ix_user_profiles_id", "user_profiles", ["id"])
+
+    op.create_table(
+        "user_images",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("image_key", sa.String(), nullable=False),
+        sa.Column("image_url", sa.String(), nullable=False),
+    )
+    op.create_index("ix_user_images_id", "user_images", ["id"])
+
+    op.create_table(
+        "profile_reports",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("reporter_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("reported_profile_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("user_profiles.user_id"), nullable=False),
+        sa.Column("reason", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("reporter_id", "reported_profile_id", name="unique_report_per_pair"),
+    )
+    op.create_index("ix_profile_reports_id", "profile_reports", ["id"])
+
+
+def downgrade():
+    op.drop_table("profile_reports")
+    op.drop_table("user_images")
+    op.drop_table("user_profiles")
+    op.drop_table("users")
@@ -0,0 +1,79 @@
+"""Facet catalog, mail dead letters, S3 deletion outbox and image variants
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in ("thumbnail_key", "thumbnail_url", "medium_key", "medium_url"):
+        op.add_column("user_images", sa.Column(column, sa.String(), nullable=True))
+
+    op.create_table(
+        "facet_counts",
+        sa.Column("dimension", sa.String(), primary_key=True),
+        sa.Column("value", sa.String(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    # Backfill from existing profiles; the app keeps it current from here on
+    op.execute("""
+        INSERT INTO facet_counts (dimension, value, count)
+        SELECT 'branch', branch, count(*) FROM user_profiles WHERE branch <> '' GROUP BY branch
+        UNION ALL
+        SELECT 'hostel', hostel, count(*) FROM user_profiles WHERE hostel <> '' GROUP BY hostel
+        UNION ALL
+        SELECT 'batch', batch, count(*) FROM user_profiles WHERE batch <> '' GROUP BY batch
+        UNION ALL
+        SELECT 'interests', tag, count(*) FROM (
+            SELECT DISTINCT p.id, t.tag
+            FROM user_profiles p,
+                 jsonb_array_elements_text(
+                     CASE WHEN jsonb_typeof(p.interests::jsonb) = 'array' THEN p.interests::jsonb ELSE '[]'::jsonb END
+                 ) AS t(tag)
+        ) tags
+        WHERE tag <> ''
+        GROUP BY tag
+    """)
+
+    op.create_table(
+        "email_dead_letters",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("to_email", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_email_dead_letters_id", "email_dead_letters", ["id"])
+
+    op.create_table(
+        "s3_deletions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("image_key", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_s3_deletions_id", "s3_deletions", ["id"])
+    op.create_index("ix_s3_deletions_next_attempt_at", "s3_deletions", ["next_attempt_at"])
+
+
+def downgrade():
+    op.drop_table("s3_deletions")
+    op.drop_table("email_dead_letters")
+    op.drop_table("facet_counts")
+    for column in ("medium_url", "medium_key", "thumbnail_url", "thumbnail_key"):
+        op.drop_column("user_images", column)
@@ -0,0 +1,43 @@
+"""Indexes for the hot query paths, built without blocking writes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# name, table, columns, extra create_index kwargs
+INDEXES = [
+    ("ix_users_username_id", "users", ["username", "id"], {}),
+    ("ix_users_username_trgm", "users", ["username"],
+     {"postgresql_using": "gin", "postgresql_ops": {"username": "gin_trgm_ops"}}),
+    ("ix_users_club_role", "users", ["club_role"], {}),
+    ("ix_user_profiles_branch", "user_profiles", ["branch"], {}),
+    ("ix_user_profiles_batch", "user_profiles", ["batch"], {}),
+    ("ix_user_profiles_hostel", "user_profiles", ["hostel"], {}),
+    ("ix_user_profiles_bio_trgm", "user_profiles", ["bio"],
+     {"postgresql_using": "gin", "postgresql_ops": {"bio": "gin_trgm_ops"}}),
+    ("ix_user_profiles_interests_gin", "user_profiles", [sa.text("(interests::jsonb)")],
+     {"postgresql_using": "gin"}),
+    ("ix_user_images_user_id", "user_images", ["user_id"], {}),
+    ("ix_profile_reports_reported_profile_id", "profile_reports", ["reported_profile_id"], {}),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,28 @@
+"""Index for newest-first pagination of profile reports
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_profile_reports_created_at_id", "profile_reports", ["created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_profile_reports_created_at_id", table_name="profile_reports",
+            postgresql_concurrently=True, if_exists=True,
+        )
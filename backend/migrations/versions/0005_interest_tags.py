@@ -0,0 +1,47 @@
+"""Normalized interest tags and the profile <-> tag join table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Existing profiles are linked by `python -m app.utils.tags` after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "interest_tags",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("slug", sa.String(), nullable=False, unique=True),
+        sa.Column("name", sa.String(), nullable=False),
+    )
+    op.create_index(
+        "ix_interest_tags_slug_pattern", "interest_tags", ["slug"],
+        postgresql_ops={"slug": "text_pattern_ops"},
+    )
+
+    op.create_table(
+        "profile_interest_tags",
+        sa.Column(
+            "profile_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("user_profiles.id", ondelete="CASCADE"), primary_key=True,
+        ),
+        sa.Column(
+            "tag_id", sa.Integer(),
+            sa.ForeignKey("interest_tags.id", ondelete="CASCADE"), primary_key=True,
+        ),
+    )
+    op.create_index("ix_profile_interest_tags_tag_id", "profile_interest_tags", ["tag_id"])
+
+
+def downgrade():
+    op.drop_table("profile_interest_tags")
+    op.drop_table("interest_tags")
@@ -0,0 +1,75 @@
+"""Count the interests facet by normalized tag slug
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+Interest facet values used to be the strings users typed, so "ML", "ml" and
+"Machine Learning" were counted separately while the filter treated them as
+one tag. Rebuilds that dimension of facet_counts from user_profiles with the
+normalization app.utils.tags had at this revision, so it does not depend on
+the tag backfill having run. The aliases and rules are copied here so later
+changes to the app module cannot change what this migration does.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+TAG_ALIASES = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "cp": "competitive programming",
+    "dsa": "data structures and algorithms",
+    "webdev": "web development",
+    "web dev": "web development",
+    "appdev": "app development",
+    "app dev": "app development",
+}
+
+
+def _slugs(interests):
+    slugs = set()
+    for interest in interests:
+        if isinstance(interest, str):
+            slug = " ".join(interest.split()).casefold()
+            slug = TAG_ALIASES.get(slug, slug)
+            if slug:
+                slugs.add(slug)
+    return slugs
+
+
+def upgrade():
+    conn = op.get_bind()
+    counts = {}
+    for interests, in conn.execute(sa.text("SELECT interests FROM user_profiles WHERE interests IS NOT NULL")):
+        if not isinstance(interests, list):
+            continue
+        for slug in _slugs(interests):
+            counts[slug] = counts.get(slug, 0) + 1
+
+    op.execute("DELETE FROM facet_counts WHERE dimension = 'interests'")
+    if counts:
+        conn.execute(
+            sa.text("INSERT INTO facet_counts (dimension, value, count) VALUES ('interests', :value, :count)"),
+            [{"value": slug, "count": count} for slug, count in counts.items()],
+        )
+
+
+def downgrade():
+    op.execute("DELETE FROM facet_counts WHERE dimension = 'interests'")
+    op.execute("""
+        INSERT INTO facet_counts (dimension, value, count)
+        SELECT 'interests', tag, count(*) FROM (
+            SELECT DISTINCT p.id, t.tag
+            FROM user_profiles p,
+                 jsonb_array_elements_text(
+                     CASE WHEN jsonb_typeof(p.interests::jsonb) = 'array' THEN p.interests::jsonb ELSE '[]'::jsonb END
+                 ) AS t(tag)
+        ) tags
+        WHERE tag <> ''
+        GROUP BY tag
+    """)
@@ -0,0 +1,4 @@
+import os
+
+# app.database builds its engines on import; no connection is opened by these tests
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg2://test@localhost/test")
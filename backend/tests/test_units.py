@@ -0,0 +1,132 @@
+"""
+Tests for the in-memory building blocks that need no database or Redis.
+
+    python -m pytest tests
+
+Run from backend/.
+"""
+import asyncio
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.utils.pagination import decode_cursor, decode_keyset, encode_cursor, encode_keyset
+from app.utils.rate_limit import MemoryRateLimiter
+from app.utils.recommendations import InterestIndex
+from app.utils.response_cache import ResponseCache
+from app.utils.tags import TagIndex, normalize_tag, profile_tag_names
+
+
+def request_with(headers=None):
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_keyset_round_trip():
+    user_id = uuid.uuid4()
+    created_at = datetime(2026, 7, 1, 12, 30)
+    cursor = encode_keyset(3, created_at, user_id)
+    assert decode_keyset(cursor, int, datetime.fromisoformat, uuid.UUID) == (3, created_at, user_id)
+    assert decode_cursor(encode_cursor("fresher", user_id)) == ("fresher", user_id)
+
+
+@pytest.mark.parametrize("cursor", ["WzEsMl0", "not a cursor", "e30", "WzFd", ""])
+def test_malformed_cursor_is_a_400(cursor):
+    # WzEsMl0 is [1,2], which used to reach UUID(2) and fail with a 500
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(cursor)
+    assert raised.value.status_code == 400
+
+
+def test_tag_normalization():
+    assert normalize_tag("  Machine   Learning ") == "machine learning"
+    assert normalize_tag("ML") == "machine learning"
+    assert normalize_tag("   ") is None
+    assert normalize_tag(None) is None
+    assert profile_tag_names(["ML", "machine learning", " Chess "]) == {"machine learning": "ML", "chess": "Chess"}
+
+
+def test_tag_index_complete():
+    index = TagIndex()
+    index.load([("machine learning", "Machine Learning", 5), ("music", "Music", 9), ("chess", "Chess", 2)])
+    assert [tag["slug"] for tag in index.complete("m")] == ["music", "machine learning"]
+    assert [tag["slug"] for tag in index.complete(" MU")] == ["music"]
+    assert [tag["slug"] for tag in index.complete("m", limit=1)] == ["music"]
+    assert index.complete("x") == []
+
+
+def test_tag_index_complete_follows_aliases():
+    index = TagIndex()
+    index.load([("machine learning", "Machine Learning", 5), ("data structures and algorithms", "DSA", 3)])
+    assert [tag["slug"] for tag in index.complete("ML")] == ["machine learning"]
+    assert [tag["slug"] for tag in index.complete("ds")] == ["data structures and algorithms"]
+
+
+def test_tag_index_apply():
+    index = TagIndex()
+    index.apply((), {"chess"}, {"chess": "Chess"})
+    assert index.complete("c") == []  # not loaded yet
+
+    index.load([("chess", "Chess", 1)])
+    index.apply((), {"chess", "go"}, {"go": "Go"})
+    assert {tag["slug"]: tag["count"] for tag in index.complete("")} == {"chess": 2, "go": 1}
+    index.apply({"go"}, ())
+    assert [tag["slug"] for tag in index.complete("g")] == []
+
+
+def test_interest_index_recommend():
+    alice, bob, carol, dave = (uuid.uuid4() for _ in range(4))
+    index = InterestIndex()
+    index.load([
+        (alice, ["ML", "chess"], "CSE", "hall 12"),
+        (bob, ["machine learning", "chess"], "EE", "hall 1"),
+        (carol, ["chess"], "CSE", "hall 12"),
+        (dave, ["music"], "CSE", "hall 12"),
+    ])
+    recommended = index.recommend(alice, ["ML", "chess"], "CSE", "hall 12")
+    # bob shares every tag; carol only chess, plus the hostel and branch bonuses
+    assert [user_id for user_id, _, _ in recommended] == [bob, carol]
+    assert recommended[0][2] == {"machine learning", "chess"}
+    assert recommended[0][1] > recommended[1][1]
+
+    index.update(dave, ["chess"], "CSE", "hall 12")
+    assert dave in [user_id for user_id, _, _ in index.recommend(alice, ["chess"], None, None)]
+    index.remove(dave)
+    assert dave not in [user_id for user_id, _, _ in index.recommend(alice, ["chess"], None, None)]
+
+
+def test_rate_limiter_window():
+    limiter = MemoryRateLimiter()
+
+    async def hits(n):
+        return [await limiter.hit("login:someone", capacity=3, rate=0.5) for _ in range(n)]
+
+    results = asyncio.run(hits(4))
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert 0 < results[3] <= 2
+    assert asyncio.run(limiter.hit("login:someone-else", capacity=3, rate=0.5)) == 0.0
+
+
+def test_cached_response_etag():
+    cache = ResponseCache()
+    entry = cache.store("key", {"items": [1, 2]}, ["profile:1"])
+
+    response = entry.to_response(request_with())
+    assert response.status_code == 200
+    assert response.body == b'{"items":[1,2]}'
+    assert response.headers["etag"] == entry.etag
+
+    assert entry.to_response(request_with({"If-None-Match": entry.etag})).status_code == 304
+    assert entry.to_response(request_with({"If-None-Match": '"stale"'})).status_code == 200
+
+
+def test_response_cache_invalidates_by_tag():
+    cache = ResponseCache()
+    cache.store("a", [1], ["profile:1"])
+    cache.store("b", [2], ["profile:2"])
+    cache.invalidate("profile:1")
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
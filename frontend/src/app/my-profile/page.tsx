@@ -97,6 +97,7 @@ const AddIntroPage: React.FC = () => {
 )
 
 const [interest, setInterest] = useState<string>('');
+const [suggestions, setSuggestions] = useState<string[]>([]);
 const fileInputRef = useRef<HTMLInputElement | null>(null)
 const [knowledge,setKnowledge] = useState<Knowledge[]>([])
 const [hasLoaded, setHasLoaded] = useState(false);
@@ -184,6 +185,33 @@ useEffect(() => {
     setKnowledge(updated);
   };
 
+  useEffect(() => {
+    const prefix = interest.trim();
+    if (!prefix) {
+      setSuggestions([]);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const res = await fetch(
+          `${BACKEND_ORIGIN}/profile/interest-tags?prefix=${encodeURIComponent(prefix)}`,
+          { signal: controller.signal }
+        );
+        if (res.ok) {
+          const tags: { name: string }[] = await res.json();
+          setSuggestions(tags.map((tag) => tag.name));
+        }
+      } catch {
+        // aborted by the next keystroke
+      }
+    }, 150);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [interest]);
+
   const handleInterestAdd = (interest: string) => {
     if (!formData.interests.includes(interest)) {
       const updated = {
@@ -207,35 +235,44 @@ useEffect(() => {
   };
 
   const uploadImagesToS3 = async (): Promise<string[]> => {
-    const keys: string[] = [];
-    for (const {file} of knowledge) {
-      try {
-        const presignRes = await fetch(`${BACKEND_ORIGIN}/s3/presign?filename=${file.name}`, {
-          credentials: 'include',
-        });
-
-        const { upload_url, fields, key } = await presignRes.json();
-
-        const uploadForm = new FormData();
-        Object.entries(fields).forEach(([k, v]) => uploadForm.append(k, v as string));
-        uploadForm.append('file', file);
-
-        const uploadRes = await fetch(upload_url, {
-          method: 'POST',
-          body: uploadForm,
-        });
+    if (knowledge.length === 0) return [];
 
-        if (!uploadRes.ok) throw new Error(`Upload failed for ${file.name}`);
-
-        keys.push(key);
-        toast.success(`${file.name} uploaded`);
-      } catch (err) {
-        toast.error(`Error uploading ${file.name}`);
-        console.error(err);
-        throw err;
-      }
+    const presignRes = await fetch(`${BACKEND_ORIGIN}/s3/presign-batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      credentials: 'include',
+      body: JSON.stringify({ filenames: knowledge.map(({ file }) => file.name) }),
+    });
+    if (!presignRes.ok) {
+      toast.error('Error preparing image upload');
+      throw new Error('Presign failed');
     }
-    return keys;
+    const { uploads } = await presignRes.json();
+
+    return Promise.all(
+      knowledge.map(async ({ file }, i) => {
+        const { upload_url, fields, key } = uploads[i];
+        try {
+          const uploadForm = new FormData();
+          Object.entries(fields).forEach(([k, v]) => uploadForm.append(k, v as string));
+          uploadForm.append('file', file);
+
+          const uploadRes = await fetch(upload_url, {
+            method: 'POST',
+            body: uploadForm,
+          });
+
+          if (!uploadRes.ok) throw new Error(`Upload failed for ${file.name}`);
+
+          toast.success(`${file.name} uploaded`);
+          return key as string;
+        } catch (err) {
+          toast.error(`Error uploading ${file.name}`);
+          console.error(err);
+          throw err;
+        }
+      })
+    );
   };
 
   const handleSubmit = async (e: FormEvent) => {
@@ -457,10 +494,16 @@ useEffect(() => {
                 type="text"
                 value={interest}
                 onChange={(e) => setInterest(e.target.value)}
+                list="interest-suggestions"
                 maxLength={20}
                 className={`flex-1 p-2 border ${styles.inputBorder} ${styles.inputBg} ${styles.textColor} rounded`}
                 placeholder="Add custom interest"
               />
+              <datalist id="interest-suggestions">
+                {suggestions.map((name) => (
+                  <option key={name} value={name} />
+                ))}
+              </datalist>
               <p className="text-xs text-gray-500 mt-1">
                 {interest.length}/20
               </p>
@@ -45,6 +45,8 @@ const formatToIST = (utcDateStr: string) => {
 
 export default function ReportsPage() {
   const [reports, setReports] = useState<Report[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const { isAuthenticated, loading_or_not, user } = useAuth();
   const [loading, setLoading] = useState(true);
   const [actionLoading, setActionLoading] = useState<string | null>(null);
@@ -68,15 +70,16 @@ export default function ReportsPage() {
     fetchReports();
   }, [user]);
 
-  const fetchReports = async () => {
+  const fetchReports = async (cursor = '') => {
     try {
-      const res = await fetch(`${ORIGIN}/profile/get-reports`, {
+      const res = await fetch(`${ORIGIN}/profile/reports?cursor=${encodeURIComponent(cursor)}`, {
         method: 'GET',
         credentials: 'include'
       });
       if (!res.ok) throw new Error('Failed to fetch reports');
       const data = await res.json();
-      setReports(data);
+      setReports((prev) => (cursor ? [...prev, ...data.items] : data.items));
+      setNextCursor(data.next_cursor);
     } catch (err) {
       console.error(err);
       toast.error('Error loading reports');
@@ -85,6 +88,13 @@ export default function ReportsPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchReports(nextCursor);
+    setLoadingMore(false);
+  };
+
   const deleteReport = async (reportId: string) => {
     setActionLoading(reportId);
     try {
@@ -212,6 +222,21 @@ export default function ReportsPage() {
           </Card>
         ))}
       </div>
+
+      {nextCursor && (
+        <div className="flex justify-center mt-8">
+          <Button variant="secondary" onClick={loadMore} disabled={loadingMore}>
+            {loadingMore ? (
+              <>
+                <Loader2 className="w-4 h-4 animate-spin mr-2" />
+                Loading
+              </>
+            ) : (
+              'Load more'
+            )}
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
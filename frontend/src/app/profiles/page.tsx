@@ -1,7 +1,7 @@
 'use client';
 
 import React, { useState, useRef, useEffect } from 'react';
-import { useInfiniteQuery } from '@tanstack/react-query';
+import { keepPreviousData, useInfiniteQuery, useQuery } from '@tanstack/react-query';
 import { Swiper, SwiperSlide } from 'swiper/react';
 import { Navigation, Pagination } from 'swiper/modules';
 import { Loader2, ChevronDown, Filter } from 'lucide-react';
@@ -19,7 +19,7 @@ import Loading from '@/components/Loading';
 import { useAuth } from '@/contexts/AuthContext';
 import { useRouter } from 'next/navigation';
 
-export type Image = { image_url: string };
+export type Image = { image_url: string; thumbnail_url?: string | null; medium_url?: string | null };
 
 export type Profile = {
   user: {
@@ -46,9 +46,33 @@ export type Profile = {
 const ORIGIN = process.env.NEXT_PUBLIC_BACKEND_ORIGIN;
 const LIMIT = 10;
 
-const fetchProfiles = async ({ pageParam = 0 }): Promise<Profile[]> => {
-  const res = await fetch(`${ORIGIN}/profile/get-all-profiles?skip=${pageParam * LIMIT}&limit=${LIMIT}`, {
-    method: 'POST',
+type FacetValue = { value: string; count: number };
+
+type SearchFilters = { q: string; branch: string; hostel: string; batch: string; interests: string };
+
+type ProfileSearchResult = {
+  items: Profile[];
+  next_cursor: string | null;
+  facets?: Record<string, FacetValue[]>;
+};
+
+type FacetCatalog = Record<string, FacetValue[]>;
+
+const fetchFacetCatalog = async (): Promise<FacetCatalog> => {
+  const res = await fetch(`${ORIGIN}/profile/facets`, { credentials: 'include' });
+  if (!res.ok) throw new Error('Failed to fetch filters');
+  return res.json();
+};
+
+const fetchProfiles = async (
+  { pageParam = '' },
+  filters: SearchFilters
+): Promise<ProfileSearchResult> => {
+  const params = new URLSearchParams({ cursor: pageParam, limit: String(LIMIT) });
+  Object.entries(filters).forEach(([key, value]) => {
+    if (value) params.set(key, value);
+  });
+  const res = await fetch(`${ORIGIN}/profile/search-profiles?${params}`, {
     credentials: 'include',
   });
   if (!res.ok) throw new Error('Failed to fetch profiles');
@@ -62,6 +86,8 @@ const UserGallery = () => {
   const [selectedBranch, setSelectedBranch] = useState<string>('');
   const [selectedHall, setSelectedHall] = useState<string>('');
   const [selectedBatch, setSelectedBatch] = useState<string>('');
+  const [selectedInterest, setSelectedInterest] = useState<string>('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
   const observerRef = useRef<HTMLDivElement | null>(null);
   const { isAuthenticated, loading_or_not } = useAuth();
 
@@ -71,6 +97,25 @@ const UserGallery = () => {
     }
   }, [loading_or_not, isAuthenticated, router]);
 
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const filters: SearchFilters = {
+    q: debouncedSearch,
+    branch: selectedBranch,
+    hostel: selectedHall,
+    batch: selectedBatch,
+    interests: selectedInterest,
+  };
+
+  const { data: facetCatalog } = useQuery({
+    queryKey: ['profile-facets'],
+    queryFn: fetchFacetCatalog,
+    staleTime: 60 * 1000,
+  });
+
   const {
     data,
     fetchNextPage,
@@ -79,13 +124,11 @@ const UserGallery = () => {
     isLoading,
     error,
   } = useInfiniteQuery({
-    queryKey: ['profiles'],
-    queryFn: ({ pageParam = 0 }) => fetchProfiles({ pageParam }),
-    getNextPageParam: (lastPage, allPages) => {
-      if (lastPage.length < LIMIT) return undefined;
-      return allPages.length;
-    },
-    initialPageParam: 0,
+    queryKey: ['profiles', filters],
+    queryFn: ({ pageParam = '' }) => fetchProfiles({ pageParam }, filters),
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    initialPageParam: '',
+    placeholderData: keepPreviousData,
   });
 
   useEffect(() => {
@@ -109,23 +152,13 @@ const UserGallery = () => {
   if (loading_or_not) return <Loading />;
   if (!isAuthenticated) return null;
 
-  const allProfiles: Profile[] = data?.pages.flat() ?? [];
-
-  const branches = Array.from(new Set(allProfiles.map(p => p.branch).filter(Boolean))) as string[];
-  const halls = Array.from(new Set(allProfiles.map(p => p.hostel).filter(Boolean))) as string[];
-  const batches = Array.from(new Set(allProfiles.map(p => p.batch).filter(Boolean))) as string[];
-
-  const filteredProfiles = allProfiles.filter((profile) => {
-    const search = searchTerm.toLowerCase();
-    return (
-      (profile.user.username.toLowerCase().includes(search) ||
-      profile.interests?.some((i) => i.toLowerCase().includes(search)) ||
-      profile.user.email.split('@')[0].includes(search)) &&
-      (!selectedBranch || profile.branch === selectedBranch) &&
-      (!selectedHall || profile.hostel === selectedHall) &&
-      (!selectedBatch || profile.batch === selectedBatch)
-    );
-  });
+  const allProfiles: Profile[] = data?.pages.flatMap(page => page.items) ?? [];
+
+  const facets = facetCatalog ?? {};
+  const branches = (facets.branch ?? []).map(f => f.value);
+  const halls = (facets.hostel ?? []).map(f => f.value);
+  const batches = (facets.batch ?? []).map(f => f.value);
+  const interestOptions = (facets.interests ?? []).map(f => f.value);
 
   return (
     <div className="min-h-screen bg-background text-foreground py-8 transition-colors duration-300">
@@ -138,7 +171,7 @@ const UserGallery = () => {
           <div className="flex gap-2 w-full">
             <input
               type="text"
-              placeholder="Search by name or interest..."
+              placeholder="Search by name or bio (filter for interests)..."
               className="flex-1 px-4 py-2 rounded-md bg-muted dark:bg-muted-dark text-foreground border border-border focus:outline-none focus:ring-2 focus:ring-primary"
               value={searchTerm}
               onChange={(e) => setSearchTerm(e.target.value)}
@@ -204,6 +237,20 @@ const UserGallery = () => {
           </select>
         </div>
 
+        <div>
+          <label className="block text-sm font-medium mb-1">Interest</label>
+          <select
+            value={selectedInterest}
+            onChange={(e) => setSelectedInterest(e.target.value)}
+            className="w-full px-3 py-2 text-sm border rounded-md bg-white dark:bg-gray-900"
+          >
+            <option value="">All Interests</option>
+            {interestOptions.map(interest => (
+              <option key={interest} value={interest}>{interest}</option>
+            ))}
+          </select>
+        </div>
+
         <button
           onClick={() => setShowFilters(false)}
           className="w-full py-2 bg-indigo-600 text-white rounded-md mt-4 hover:bg-indigo-700 transition"
@@ -222,7 +269,7 @@ const UserGallery = () => {
       </div>
 
       <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8">
-        {filteredProfiles.length > 0 ? filteredProfiles.map((profile) => (
+        {allProfiles.length > 0 ? allProfiles.map((profile) => (
           <div
             key={profile.user.id}
             className="group relative bg-gray-100 mx-4 dark:bg-gray-900 rounded-lg overflow-hidden shadow-md border border-gray-300 dark:border-gray-700 transition-all p-4 h-full hover:shadow-lg hover:border-indigo-500"
@@ -238,11 +285,11 @@ const UserGallery = () => {
                 >
                   {(profile.user.images.length > 0
                     ? profile.user.images
-                    : [{ image_url: '/images/profile-placeholder.jpg' }]
+                    : [{ image_url: '/images/profile-placeholder.jpg', thumbnail_url: null }]
                   ).map((img, i) => (
                     <SwiperSlide key={i}>
                       <img
-                        src={img.image_url}
+                        src={img.thumbnail_url || img.image_url}
                         alt={`Photo ${i} of ${profile.user.username}`}
                         loading="lazy"
                         className="w-full h-full object-cover"
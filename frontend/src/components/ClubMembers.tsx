@@ -10,7 +10,7 @@ import Image from 'next/image';
 import Link from 'next/link';
 function ProfileCard({ profile }: { profile: Profile }) {
   const { user, branch, batch } = profile;
-  const imageUrl = user.images[0]?.image_url || '/default-avatar.png';
+  const imageUrl = user.images[0]?.thumbnail_url || user.images[0]?.image_url || '/default-avatar.png';
 
   return (
     <div
@@ -32,11 +32,11 @@ function ProfileCard({ profile }: { profile: Profile }) {
               >
                 {(profile.user.images.length > 0
                   ? profile.user.images
-                  : [{ image_url: '/images/profile-placeholder.jpg' }]
+                  : [{ image_url: '/images/profile-placeholder.jpg', thumbnail_url: null }]
                 ).map((img, i) => (
                   <SwiperSlide key={i}>
                     <img
-                      src={img.image_url}
+                      src={img.thumbnail_url || img.image_url}
                       alt={`Photo ${i} of ${profile.user.username}`}
                       loading="lazy"
                       className="w-full h-full object-cover"  // Ensures image fills container
@@ -26,7 +26,7 @@ const ProfileCard = ({ profile }: { profile: Profile }) => (
             <SwiperSlide key={i}>
               <div className="relative w-full h-full">
                 <Image
-                  src={obj.image_url}
+                  src={obj.medium_url || obj.image_url}
                   alt={`Photo ${i + 1} of ${profile.user.username}`}
                   fill
                   className="object-cover rounded-xl"
@@ -16,7 +16,7 @@ import {
 export default function ProfileDetails({ profile }: { profile: Profile }) {
   const images =
     profile.user.images.length > 0
-      ? profile.user.images.map((img) => img.image_url)
+      ? profile.user.images.map((img) => img.medium_url || img.image_url)
       : ['/images/profile-placeholder.jpg'];
 
   return (
@@ -1,4 +1,4 @@
-export type Image = { image_url: string };
+export type Image = { image_url: string; thumbnail_url?: string | null; medium_url?: string | null };
 export type Knowledge = { file: File; preview: string };
 export type User = { username: string, email: string, id: number, is_verified: boolean, images: Image[] }
 export type Profile = {